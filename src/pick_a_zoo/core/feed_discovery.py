@@ -3,28 +3,25 @@
 This module follows the library-first architecture principle and is independently testable.
 """
 
+import atexit
+import functools
 import re
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
+from typing import Any
 from urllib.parse import urljoin, urlparse
 
 import httpx
-from bs4 import BeautifulSoup
 from loguru import logger
+from lxml import etree
 from pydantic import BaseModel, Field
 
-try:
-    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-    from playwright.sync_api import sync_playwright
 
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
-    sync_playwright = None  # type: ignore[assignment]
-    # Use Exception as fallback when Playwright is unavailable
-    PlaywrightTimeoutError = Exception  # type: ignore[assignment, misc]
-
-
-def _get_browser_headers(url: str | None = None) -> dict[str, str]:
+def get_browser_headers(url: str | None = None) -> dict[str, str]:
     """Get browser-like HTTP headers to avoid bot detection.
 
     Args:
@@ -66,6 +63,61 @@ def _get_browser_headers(url: str | None = None) -> dict[str, str]:
     return headers
 
 
+_http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """Get the shared HTTP client used for page fetches.
+
+    The client is created on first use and keeps connections alive between
+    requests, so repeated fetches against the same host reuse sockets instead
+    of paying DNS, TCP and TLS setup every time. Headers and timeouts are
+    passed per request.
+
+    Returns:
+        Process-wide httpx.Client, closed automatically at interpreter exit
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            )
+            atexit.register(_http_client.close)
+        return _http_client
+
+
+# HEAD refusals that are worth retrying as a GET (some CDNs reject HEAD outright)
+_HEAD_REFUSED_STATUSES = frozenset({httpx.codes.FORBIDDEN, httpx.codes.METHOD_NOT_ALLOWED})
+
+
+def _head_or_ranged_get(url: str, timeout: float) -> httpx.Response:
+    """Probe a URL on the shared client: HEAD, then a one-byte GET if HEAD is refused.
+
+    The GET asks for Range bytes=0-0 and is streamed and closed without reading,
+    so no body is downloaded even from servers that ignore the range.
+
+    Args:
+        url: URL to probe (redirects are followed)
+        timeout: Timeout in seconds
+
+    Returns:
+        The final response, with its redirect history
+    """
+    client = get_http_client()
+    headers = get_browser_headers(url)
+    response = client.head(url, headers=headers, timeout=timeout)
+    if response.status_code in _HEAD_REFUSED_STATUSES:
+        logger.debug(f"HEAD refused with {response.status_code}, retrying as ranged GET: {url}")
+        with client.stream(
+            "GET", url, headers={**headers, "Range": "bytes=0-0"}, timeout=timeout
+        ) as response:
+            pass
+    return response
+
+
 def fetch_html_with_playwright(url: str, timeout: float = 30.0) -> str:
     """Fetch HTML content using Playwright (headless browser).
 
@@ -83,14 +135,18 @@ def fetch_html_with_playwright(url: str, timeout: float = 30.0) -> str:
     Raises:
         FeedDiscoveryError: If Playwright is not available or fetch fails
     """
-    if not PLAYWRIGHT_AVAILABLE or sync_playwright is None:
+    # Imported here: Playwright is heavy and only needed for the 403 fallback
+    try:
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        from playwright.sync_api import sync_playwright
+    except ImportError as e:
         raise FeedDiscoveryError(
             "Playwright is not installed. Install it with: playwright install",
             (
                 "Browser automation is not available. "
                 "Please install Playwright or use a direct stream URL."
             ),
-        )
+        ) from e
 
     logger.info(f"Fetching HTML with Playwright: {url}")
 
@@ -147,13 +203,21 @@ class URLType(Enum):
     HTML_PAGE = "html_page"
 
 
-class StreamCandidate(BaseModel):
-    """Represents a candidate stream URL extracted from HTML."""
+@dataclass(frozen=True, slots=True)
+class StreamCandidate:
+    """Represents a candidate stream URL extracted from HTML.
 
-    url: str = Field(description="Extracted stream URL")
-    source_type: str = Field(
-        description=("How it was found (e.g., 'video_tag', 'source_tag', " "'m3u8_link', 'iframe')")
-    )
+    A slotted, immutable value type rather than a Pydantic model: pages can yield
+    many candidates, and every field is produced by the extractor itself, so there
+    is nothing to validate and no per-instance __dict__ to pay for.
+
+    Attributes:
+        url: Extracted stream URL
+        source_type: How it was found (e.g., 'video_tag', 'source_tag', 'm3u8_link', 'iframe')
+    """
+
+    url: str
+    source_type: str
 
 
 class URLValidationResult(BaseModel):
@@ -193,11 +257,20 @@ class URLValidationError(FeedDiscoveryError):
     pass
 
 
+# Direct stream URLs: a streaming scheme, or a media file extension ending the path
+# (optionally followed by a query string or fragment, as on signed CDN URLs)
+_DIRECT_STREAM_RE = re.compile(
+    r"^(?:rtsp|rtmp)://|\.(?:m3u8|mp4|webm|mkv|flv|ts)(?:$|[?#])", re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=512)
 def detect_url_type(url: str) -> URLType:
     """Detect whether URL is a direct stream or HTML page.
 
     Uses pattern matching first (fast), then falls back to HTTP HEAD request
-    to check Content-Type header. Handles redirects up to 5 levels.
+    to check Content-Type header. Handles redirects up to 5 levels. Results are
+    cached per URL (failures are not); clear_url_caches() forgets them.
 
     Args:
         url: URL string to analyze
@@ -211,55 +284,43 @@ def detect_url_type(url: str) -> URLType:
     logger.debug(f"Detecting URL type for: {url}")
 
     # Pattern matching for direct streams (fast path)
-    direct_stream_patterns = [
-        r"\.m3u8$",
-        r"\.mp4$",
-        r"\.webm$",
-        r"\.mkv$",
-        r"\.flv$",
-        r"rtsp://",
-        r"rtmp://",
-    ]
-
-    for pattern in direct_stream_patterns:
-        if re.search(pattern, url, re.IGNORECASE):
-            logger.debug(f"URL matched direct stream pattern: {pattern}")
-            return URLType.DIRECT_STREAM
+    match = _DIRECT_STREAM_RE.search(url)
+    if match:
+        logger.debug(f"URL matched direct stream pattern: {match.group(0)}")
+        return URLType.DIRECT_STREAM
 
     # HTTP HEAD request fallback for Content-Type checking
     try:
-        headers = _get_browser_headers(url)
-        with httpx.Client(follow_redirects=True, timeout=15.0, headers=headers) as client:
-            response = client.head(url, follow_redirects=True)
-            # httpx handles redirects automatically, but we track them manually for logging
-            redirect_count = len(response.history)
-            if redirect_count > 5:
-                logger.warning(f"URL exceeded 5 redirects: {redirect_count}")
-                raise FeedDiscoveryError(
-                    f"URL exceeded maximum redirect limit (5): {url}",
-                    "URL redirects too many times. Please check the URL.",
-                )
-
-            content_type = response.headers.get("Content-Type", "").lower()
-            logger.debug(f"Content-Type: {content_type}")
-
-            # Check if Content-Type indicates HTML
-            if "text/html" in content_type:
-                logger.debug("URL detected as HTML page via Content-Type")
-                return URLType.HTML_PAGE
-
-            # Check if Content-Type indicates video stream
-            if any(
-                content_type.startswith(prefix)
-                for prefix in ["video/", "application/vnd.apple.mpegurl", "application/x-mpegurl"]
-            ):
-                logger.debug("URL detected as direct stream via Content-Type")
-                return URLType.DIRECT_STREAM
-
-            # Default to HTML_PAGE if Content-Type is ambiguous
-            logger.debug("URL defaulting to HTML_PAGE (ambiguous Content-Type)")
+        response = _head_or_ranged_get(url, timeout=15.0)
+        # httpx handles redirects automatically, but we track them manually for logging
+        redirect_count = len(response.history)
+        if redirect_count > 5:
+            logger.warning(f"URL exceeded 5 redirects: {redirect_count}")
+            raise FeedDiscoveryError(
+                f"URL exceeded maximum redirect limit (5): {url}",
+                "URL redirects too many times. Please check the URL.",
+            )
+
+        content_type = response.headers.get("Content-Type", "").lower()
+        logger.debug(f"Content-Type: {content_type}")
+
+        # Check if Content-Type indicates HTML
+        if "text/html" in content_type:
+            logger.debug("URL detected as HTML page via Content-Type")
             return URLType.HTML_PAGE
 
+        # Check if Content-Type indicates video stream
+        if any(
+            content_type.startswith(prefix)
+            for prefix in ["video/", "application/vnd.apple.mpegurl", "application/x-mpegurl"]
+        ):
+            logger.debug("URL detected as direct stream via Content-Type")
+            return URLType.DIRECT_STREAM
+
+        # Default to HTML_PAGE if Content-Type is ambiguous
+        logger.debug("URL defaulting to HTML_PAGE (ambiguous Content-Type)")
+        return URLType.HTML_PAGE
+
     except httpx.TimeoutException as e:
         logger.error(f"Timeout detecting URL type: {e}")
         raise URLValidationError(
@@ -286,7 +347,257 @@ def detect_url_type(url: str) -> URLType:
         ) from e
 
 
-def extract_streams_from_html(html_content: str, base_url: str) -> list[StreamCandidate]:
+# Stream URL patterns searched in page text and inline scripts
+_STREAM_PATTERNS = [
+    (re.compile(r"https?://[^\s\"'<>]+\.m3u8[^\s\"'<>]*", re.IGNORECASE), "m3u8_link"),
+    (re.compile(r"https?://[^\s\"'<>]+\.mp4[^\s\"'<>]*", re.IGNORECASE), "mp4_link"),
+    (re.compile(r"https?://[^\s\"'<>]+\.webm[^\s\"'<>]*", re.IGNORECASE), "webm_link"),
+    (re.compile(r"https?://[^\s\"'<>]+\.m3u[^\s\"'<>]*", re.IGNORECASE), "m3u_link"),
+]
+
+# Extensions that mark a matched URL as clearly not a stream (images, CSS, JS files)
+_NON_STREAM_EXTS = (".jpg", ".jpeg", ".png", ".gif", ".css", ".js", ".json")
+
+# Elements whose text is code or markup rather than visible page text
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+# Default cap on stream candidates collected from a single page
+MAX_STREAM_CANDIDATES = 8
+
+# Bytes handed to the HTML pull parser per feed() call
+_HTML_CHUNK_SIZE = 65536
+
+# Upper bound on concurrent HEAD probes in validate_urls_accessibility
+MAX_VALIDATION_WORKERS = 8
+
+# Common video player domains recognised in iframes
+_COMMON_PLAYER_DOMAINS = (
+    "youtube.com",
+    "youtu.be",
+    "vimeo.com",
+    "dailymotion.com",
+    "twitch.tv",
+)
+
+
+class HTMLStreamExtractor:
+    """Incrementally extract stream URLs from an HTML document fed in chunks.
+
+    The document is parsed with lxml's pull parser and elements are discarded as
+    soon as they have been visited, so memory use stays bounded by the nesting
+    depth of the page rather than its size. Candidates are reported in the same
+    order as a whole-document scan: <video>/<source> URLs, then links in the
+    visible page text, then links in inline scripts, each grouped by pattern.
+
+    With max_candidates set, the extractor reports is_full once that many unique
+    URLs have been seen; callers stop feeding at that point so the rest of the
+    document is never downloaded or parsed.
+
+    Example:
+        >>> extractor = HTMLStreamExtractor("https://zoo.example.com/")
+        >>> extractor.feed(b'<video src="/cam.m3u8"></video>')
+        >>> [c.url for c in extractor.close()]
+        ['https://zoo.example.com/cam.m3u8']
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        encoding: str | None = "utf-8",
+        max_candidates: int | None = None,
+    ) -> None:
+        """Initialize the extractor.
+
+        Args:
+            base_url: Base URL for resolving relative URLs
+            encoding: Character encoding of the fed bytes; None lets libxml2 detect it
+            max_candidates: Stop collecting once this many unique URLs are found
+                (None collects the whole document)
+        """
+        self.base_url = base_url
+        self.max_candidates = max_candidates
+        self._parser = etree.HTMLPullParser(events=("start", "end"), encoding=encoding)
+        self._fed = False
+        self._tag_streams: list[tuple[str, str]] = []
+        self._text_streams: list[list[str]] = [[] for _ in _STREAM_PATTERNS]
+        self._script_streams: list[list[str]] = [[] for _ in _STREAM_PATTERNS]
+        self._seen_urls: set[str] = set()
+        # Open elements paired with whether their leading text has been scanned
+        self._open: list[tuple[Any, list[bool]]] = []
+        self._video_depth = 0
+
+    @property
+    def candidate_count(self) -> int:
+        """Number of unique stream URLs found so far."""
+        return len(self._seen_urls)
+
+    @property
+    def is_full(self) -> bool:
+        """Whether max_candidates unique URLs have been found."""
+        return self.max_candidates is not None and len(self._seen_urls) >= self.max_candidates
+
+    def feed(self, data: bytes) -> None:
+        """Parse the next chunk of the document.
+
+        Chunks fed after the extractor is full are ignored.
+
+        Args:
+            data: Raw bytes of the HTML document
+
+        Raises:
+            HTMLParseError: If HTML parsing fails
+        """
+        if not data or self.is_full:
+            return
+        try:
+            self._parser.feed(data)
+            self._fed = True
+            self._drain_events()
+        except Exception as e:
+            logger.error(f"Failed to parse HTML: {e}")
+            raise HTMLParseError(
+                f"Failed to parse HTML content: {e}",
+                "Unable to parse the webpage. The page may be malformed or unsupported.",
+            ) from e
+
+    def close(self) -> list[StreamCandidate]:
+        """Finish parsing and return the extracted candidates.
+
+        Returns:
+            List of StreamCandidate objects with extracted URLs
+            (at most max_candidates when set)
+
+        Raises:
+            HTMLParseError: If HTML parsing fails
+        """
+        if self._fed:
+            try:
+                self._parser.close()
+                self._drain_events()
+            except Exception as e:
+                logger.error(f"Failed to parse HTML: {e}")
+                raise HTMLParseError(
+                    f"Failed to parse HTML content: {e}",
+                    "Unable to parse the webpage. The page may be malformed or unsupported.",
+                ) from e
+
+        streams: list[StreamCandidate] = []
+        seen_urls: set[str] = set()
+
+        def add(url: str, source_type: str) -> None:
+            if url not in seen_urls:
+                streams.append(StreamCandidate(url=url, source_type=source_type))
+                seen_urls.add(url)
+
+        for url, source_type in self._tag_streams:
+            add(url, source_type)
+        for (_, source_type), urls in zip(_STREAM_PATTERNS, self._text_streams, strict=True):
+            for url in urls:
+                add(url, source_type)
+        for (_, source_type), urls in zip(_STREAM_PATTERNS, self._script_streams, strict=True):
+            for url in urls:
+                add(url, f"script_{source_type}")
+
+        if self.max_candidates is not None:
+            del streams[self.max_candidates :]
+
+        logger.info(f"Extracted {len(streams)} unique streams from HTML")
+        return streams
+
+    def _drain_events(self) -> None:
+        """Visit the elements parsed so far and discard the finished ones."""
+        for event, element in self._parser.read_events():
+            if self.is_full:
+                break
+            if event == "start":
+                self._on_start(element)
+            else:
+                self._on_end(element)
+
+    def _on_start(self, element: Any) -> None:
+        """Handle an opening tag: attributes are complete, content may not be."""
+        if self._open:
+            parent, parent_text_scanned = self._open[-1]
+            if not parent_text_scanned[0]:
+                self._scan_text(parent, parent.text)
+                parent_text_scanned[0] = True
+            # Earlier siblings are finished: scan their tails and drop them
+            for sibling in parent[: parent.index(element)]:
+                self._scan_text(parent, sibling.tail)
+                parent.remove(sibling)
+        self._open.append((element, [False]))
+
+        tag = element.tag
+        if tag == "video":
+            self._video_depth += 1
+            self._add_attribute_url(element.get("src"), "video_tag")
+        elif tag == "source" and self._video_depth:
+            self._add_attribute_url(element.get("src"), "source_tag")
+            srcset_attr = element.get("srcset")
+            if srcset_attr:
+                # Parse srcset (format: "url1 1x, url2 2x" or "url1 100w, url2 200w")
+                for src_entry in srcset_attr.split(","):
+                    url_part = src_entry.strip().split()
+                    if url_part:
+                        self._add_attribute_url(url_part[0], "source_tag")
+        elif tag == "iframe":
+            iframe_src = element.get("src", "")
+            if iframe_src:
+                domain = urlparse(iframe_src).netloc.lower()
+                if any(player_domain in domain for player_domain in _COMMON_PLAYER_DOMAINS):
+                    # For now, we just log these - full player API integration is deferred
+                    logger.debug(f"Found iframe with video player domain: {domain}")
+
+    def _on_end(self, element: Any) -> None:
+        """Handle a closing tag: the element and its children are complete."""
+        _, text_scanned = self._open.pop()
+        if not text_scanned[0]:
+            self._scan_text(element, element.text)
+        for child in element:
+            self._scan_text(element, child.tail)
+
+        tag = element.tag
+        if tag == "video":
+            self._video_depth -= 1
+        elif tag == "script":
+            script_content = element.text or ""
+            if not script_content:
+                # Fall back to the serialized tag (e.g. a src attribute on an external script)
+                script_content = etree.tostring(element, encoding="unicode", with_tail=False)
+            self._scan_links(script_content, self._script_streams)
+
+        element.clear(keep_tail=True)
+
+    def _add_attribute_url(self, value: str | None, source_type: str) -> None:
+        """Record a URL taken from a tag attribute, resolved against the base URL."""
+        if value:
+            url = urljoin(self.base_url, value)
+            self._tag_streams.append((url, source_type))
+            if url not in self._seen_urls:
+                self._seen_urls.add(url)
+                logger.debug(f"Found stream in <{source_type.split('_')[0]}> tag: {url}")
+
+    def _scan_text(self, owner: Any, text: str | None) -> None:
+        """Scan a visible text node; text owned by script/style/template is skipped."""
+        if text and isinstance(owner.tag, str) and owner.tag not in _NON_TEXT_TAGS:
+            self._scan_links(text, self._text_streams)
+
+    def _scan_links(self, text: str, buckets: list[list[str]]) -> None:
+        """Record every stream link in text into the per-pattern buckets."""
+        for (pattern, source_type), bucket in zip(_STREAM_PATTERNS, buckets, strict=True):
+            for match in pattern.finditer(text):
+                url = match.group(0)
+                if any(ext in url.lower() for ext in _NON_STREAM_EXTS):
+                    continue
+                bucket.append(url)
+                if url not in self._seen_urls:
+                    self._seen_urls.add(url)
+                    logger.debug(f"Found {source_type}: {url}")
+
+
+def extract_streams_from_html(
+    html_content: str, base_url: str, max_candidates: int | None = MAX_STREAM_CANDIDATES
+) -> list[StreamCandidate]:
     """Extract stream URLs from HTML content.
 
     Extracts from:
@@ -295,9 +606,15 @@ def extract_streams_from_html(html_content: str, base_url: str) -> list[StreamCa
     - m3u8 links in page content
     - Basic iframe extraction (common video player domains)
 
+    The page is tokenized by libxml2 through lxml's HTMLPullParser (see
+    HTMLStreamExtractor), never by a pure-Python parser. Parsing stops as soon as
+    max_candidates unique URLs have been found; cam pages usually embed their
+    stream near the top, so the rest of the page is skipped.
+
     Args:
         html_content: HTML content string
         base_url: Base URL for resolving relative URLs
+        max_candidates: Maximum number of candidates to return (None scans the whole page)
 
     Returns:
         List of StreamCandidate objects with extracted URLs
@@ -307,130 +624,63 @@ def extract_streams_from_html(html_content: str, base_url: str) -> list[StreamCa
     """
     logger.debug(f"Extracting streams from HTML (base_url: {base_url})")
 
-    try:
-        soup = BeautifulSoup(html_content, "lxml")
-    except Exception as e:
-        logger.error(f"Failed to parse HTML: {e}")
-        raise HTMLParseError(
-            f"Failed to parse HTML content: {e}",
-            "Unable to parse the webpage. The page may be malformed or unsupported.",
-        ) from e
+    # Parse from UTF-8 bytes so pages carrying an XML encoding declaration are accepted
+    data = html_content.encode("utf-8")
+    extractor = HTMLStreamExtractor(base_url, max_candidates=max_candidates)
+    for offset in range(0, len(data), _HTML_CHUNK_SIZE):
+        extractor.feed(data[offset : offset + _HTML_CHUNK_SIZE])
+        if extractor.is_full:
+            break
+    return extractor.close()
 
-    streams: list[StreamCandidate] = []
-    seen_urls: set[str] = set()
 
-    # Extract from <video> tags
-    for video_tag in soup.find_all("video"):
-        # Check src attribute
-        src_attr = video_tag.get("src")
-        if src_attr and isinstance(src_attr, str):
-            url = urljoin(base_url, src_attr)
-            if url not in seen_urls:
-                streams.append(StreamCandidate(url=url, source_type="video_tag"))
-                seen_urls.add(url)
-                logger.debug(f"Found stream in <video> src: {url}")
-
-        # Check <source> children
-        for source_tag in video_tag.find_all("source"):
-            src_attr = source_tag.get("src")
-            if src_attr and isinstance(src_attr, str):
-                url = urljoin(base_url, src_attr)
-                if url not in seen_urls:
-                    streams.append(StreamCandidate(url=url, source_type="source_tag"))
-                    seen_urls.add(url)
-                    logger.debug(f"Found stream in <source> tag: {url}")
-
-            # Check srcset attribute
-            srcset_attr = source_tag.get("srcset")
-            if srcset_attr and isinstance(srcset_attr, str):
-                # Parse srcset (format: "url1 1x, url2 2x" or "url1 100w, url2 200w")
-                for src_entry in srcset_attr.split(","):
-                    url_part = src_entry.strip().split()[0]
-                    url = urljoin(base_url, url_part)
-                    if url not in seen_urls:
-                        streams.append(StreamCandidate(url=url, source_type="source_tag"))
-                        seen_urls.add(url)
-                        logger.debug(f"Found stream in <source> srcset: {url}")
-
-    # Extract from standalone <source> tags
-    for source_tag in soup.find_all("source", recursive=False):
-        src_attr = source_tag.get("src")
-        if src_attr and isinstance(src_attr, str):
-            url = urljoin(base_url, src_attr)
-            if url not in seen_urls:
-                streams.append(StreamCandidate(url=url, source_type="source_tag"))
-                seen_urls.add(url)
-                logger.debug(f"Found stream in standalone <source> tag: {url}")
-
-    # Search for stream URLs in page content (including text nodes)
-    stream_patterns = [
-        (r"https?://[^\s\"'<>]+\.m3u8[^\s\"'<>]*", "m3u8_link"),
-        (r"https?://[^\s\"'<>]+\.mp4[^\s\"'<>]*", "mp4_link"),
-        (r"https?://[^\s\"'<>]+\.webm[^\s\"'<>]*", "webm_link"),
-        (r"https?://[^\s\"'<>]+\.m3u[^\s\"'<>]*", "m3u_link"),
-    ]
-
-    # Search in page text content
-    page_text = soup.get_text()
-    for pattern, source_type in stream_patterns:
-        for match in re.finditer(pattern, page_text, re.IGNORECASE):
-            url = match.group(0)
-            # Filter out URLs that are clearly not streams
-            # (e.g., images, CSS, JS files)
-            non_stream_exts = [".jpg", ".jpeg", ".png", ".gif", ".css", ".js", ".json"]
-            if any(ext in url.lower() for ext in non_stream_exts):
-                continue
-            if url not in seen_urls:
-                streams.append(StreamCandidate(url=url, source_type=source_type))
-                seen_urls.add(url)
-                logger.debug(f"Found {source_type} in page content: {url}")
+# Seconds a successful accessibility check is reused before the URL is probed again
+VALIDATION_CACHE_TTL = 60.0
 
-    # Search for stream URLs in JavaScript code within <script> tags
-    for script_tag in soup.find_all("script"):
-        script_content = script_tag.string if script_tag.string else ""
-        if not script_content:
-            # Try to get content from script tag
-            script_content = str(script_tag)
+# Most URLs whose successful validation is remembered at once
+_MAX_CACHED_VALIDATIONS = 512
+
+# url -> (time.monotonic() when validated, result); only accessible results are kept
+_validation_cache: dict[str, tuple[float, URLValidationResult]] = {}
+_validation_cache_lock = threading.Lock()
+
+
+def clear_url_caches() -> None:
+    """Forget cached detect_url_type and validate_url_accessibility results."""
+    detect_url_type.cache_clear()
+    with _validation_cache_lock:
+        _validation_cache.clear()
 
-        for pattern, source_type in stream_patterns:
-            for match in re.finditer(pattern, script_content, re.IGNORECASE):
-                url = match.group(0)
-                # Filter out non-stream URLs
-                non_stream_exts = [".jpg", ".jpeg", ".png", ".gif", ".css", ".js", ".json"]
-                if any(ext in url.lower() for ext in non_stream_exts):
-                    continue
-                if url not in seen_urls:
-                    streams.append(StreamCandidate(url=url, source_type=f"script_{source_type}"))
-                    seen_urls.add(url)
-                    logger.debug(f"Found {source_type} in script tag: {url}")
-
-    # Basic iframe extraction (common video player domains)
-    common_player_domains = [
-        "youtube.com",
-        "youtu.be",
-        "vimeo.com",
-        "dailymotion.com",
-        "twitch.tv",
-    ]
-    for iframe_tag in soup.find_all("iframe"):
-        iframe_src = iframe_tag.get("src", "")
-        if iframe_src and isinstance(iframe_src, str):
-            parsed = urlparse(iframe_src)
-            domain = parsed.netloc.lower()
-            if any(player_domain in domain for player_domain in common_player_domains):
-                # For now, we just log these - full player API integration is deferred
-                logger.debug(f"Found iframe with video player domain: {domain}")
-                # Note: Full iframe extraction would require player-specific APIs
-
-    logger.info(f"Extracted {len(streams)} unique streams from HTML")
-    return streams
+
+def _get_cached_validation(url: str) -> URLValidationResult | None:
+    """Return a successful validation of url from the last VALIDATION_CACHE_TTL seconds."""
+    with _validation_cache_lock:
+        entry = _validation_cache.get(url)
+        if entry is None:
+            return None
+        validated_at, result = entry
+        if time.monotonic() - validated_at > VALIDATION_CACHE_TTL:
+            del _validation_cache[url]
+            return None
+        return result
+
+
+def _store_validation(url: str, result: URLValidationResult) -> None:
+    """Remember an accessible result, evicting the oldest entry when the cache is full."""
+    with _validation_cache_lock:
+        _validation_cache.pop(url, None)
+        if len(_validation_cache) >= _MAX_CACHED_VALIDATIONS:
+            del _validation_cache[next(iter(_validation_cache))]
+        _validation_cache[url] = (time.monotonic(), result)
 
 
 def validate_url_accessibility(url: str, timeout: float = 15.0) -> URLValidationResult:
     """Validate that a URL is accessible.
 
     Performs HTTP HEAD request with timeout. Handles redirects up to 5 levels.
-    Checks HTTP status codes (200-299 = accessible).
+    Checks HTTP status codes (200-299 = accessible). A URL found accessible is
+    not probed again for VALIDATION_CACHE_TTL seconds; failures are never cached,
+    so a retry after an error always hits the network.
 
     Args:
         url: URL string to validate
@@ -442,42 +692,48 @@ def validate_url_accessibility(url: str, timeout: float = 15.0) -> URLValidation
     Raises:
         URLValidationError: If validation fails (network error, etc.)
     """
+    cached = _get_cached_validation(url)
+    if cached is not None:
+        logger.debug(f"Using cached accessibility result for {url}")
+        return cached
+
     logger.debug(f"Validating URL accessibility: {url} (timeout: {timeout}s)")
 
     try:
-        headers = _get_browser_headers(url)
-        with httpx.Client(follow_redirects=True, timeout=timeout, headers=headers) as client:
-            response = client.head(url, follow_redirects=True)
-
-            # Track redirects
-            redirect_count = len(response.history)
-            if redirect_count > 5:
-                logger.warning(f"URL exceeded 5 redirects: {redirect_count}")
-                return URLValidationResult(
-                    is_accessible=False,
-                    status_code=response.status_code,
-                    error_message=(
-                        f"URL exceeded maximum redirect limit (5): " f"{redirect_count} redirects"
-                    ),
-                    content_type=response.headers.get("Content-Type"),
-                )
-
-            # Check status code
-            is_accessible = 200 <= response.status_code < 300
-            content_type = response.headers.get("Content-Type")
-
-            if is_accessible:
-                logger.debug(f"URL is accessible (status: {response.status_code})")
-            else:
-                logger.warning(f"URL is not accessible (status: {response.status_code})")
+        response = _head_or_ranged_get(url, timeout=timeout)
 
+        # Track redirects
+        redirect_count = len(response.history)
+        if redirect_count > 5:
+            logger.warning(f"URL exceeded 5 redirects: {redirect_count}")
             return URLValidationResult(
-                is_accessible=is_accessible,
+                is_accessible=False,
                 status_code=response.status_code,
-                error_message=None if is_accessible else f"HTTP {response.status_code}",
-                content_type=content_type,
+                error_message=(
+                    f"URL exceeded maximum redirect limit (5): {redirect_count} redirects"
+                ),
+                content_type=response.headers.get("Content-Type"),
             )
 
+        # Check status code
+        is_accessible = 200 <= response.status_code < 300
+        content_type = response.headers.get("Content-Type")
+
+        if is_accessible:
+            logger.debug(f"URL is accessible (status: {response.status_code})")
+        else:
+            logger.warning(f"URL is not accessible (status: {response.status_code})")
+
+        result = URLValidationResult(
+            is_accessible=is_accessible,
+            status_code=response.status_code,
+            error_message=None if is_accessible else f"HTTP {response.status_code}",
+            content_type=content_type,
+        )
+        if is_accessible:
+            _store_validation(url, result)
+        return result
+
     except httpx.TimeoutException as e:
         logger.error(f"Timeout validating URL: {e}")
         raise URLValidationError(
@@ -522,3 +778,37 @@ def validate_url_accessibility(url: str, timeout: float = 15.0) -> URLValidation
             f"Unexpected error while validating URL: {url}",
             "An unexpected error occurred. Please try again.",
         ) from e
+
+
+def validate_urls_accessibility(
+    urls: Iterable[str], timeout: float = 15.0
+) -> dict[str, URLValidationResult]:
+    """Validate several URLs at once, probing them concurrently.
+
+    Each URL is checked with validate_url_accessibility on a small thread pool,
+    so a batch takes about as long as its slowest URL instead of the sum of all
+    round trips. Duplicate URLs are probed once.
+
+    Args:
+        urls: URL strings to validate
+        timeout: Per-request timeout in seconds (default: 15.0)
+
+    Returns:
+        Mapping of each URL to its URLValidationResult, in input order. URLs whose
+        validation raised URLValidationError are reported as not accessible with
+        the error's user message.
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+
+    def validate(url: str) -> URLValidationResult:
+        try:
+            return validate_url_accessibility(url, timeout=timeout)
+        except URLValidationError as e:
+            return URLValidationResult(is_accessible=False, error_message=e.user_message)
+
+    logger.debug(f"Validating {len(unique_urls)} URLs concurrently")
+    workers = min(len(unique_urls), MAX_VALIDATION_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="url-validate") as pool:
+        return dict(zip(unique_urls, pool.map(validate, unique_urls), strict=True))
@@ -3,6 +3,7 @@
 This module follows the library-first architecture principle and is independently testable.
 """
 
+import os
 import re
 import shutil
 import tempfile
@@ -10,8 +11,17 @@ from pathlib import Path
 
 import yaml
 from loguru import logger
+from pydantic import TypeAdapter, ValidationError
 
 from pick_a_zoo.core.models import Feed, WindowSize
+from pick_a_zoo.core.yaml_io import SafeDumper, SafeLoader
+
+# A line break followed by anything but a "- " item line, a two-space indented
+# line or the end of the file: marks a config that is not in save_feeds' layout
+_FOREIGN_LINE_RE = re.compile(rb"\n(?!- |  |\Z)")
+
+# Built once so every load reuses the compiled list[Feed] validator
+_FEED_LIST_ADAPTER = TypeAdapter(list[Feed])
 
 
 def get_config_path() -> Path:
@@ -25,6 +35,19 @@ def get_config_path() -> Path:
     return config_path
 
 
+def get_config_mtime_ns() -> int | None:
+    """Get the modification time of the feeds configuration file.
+
+    Returns:
+        Modification time in nanoseconds, or None if the file does not exist or
+        cannot be accessed.
+    """
+    try:
+        return get_config_path().stat().st_mtime_ns
+    except OSError:
+        return None
+
+
 def load_feeds() -> list[Feed]:
     """Load camera feeds from the configuration file.
 
@@ -59,7 +82,7 @@ def load_feeds() -> list[Feed]:
     # Try to load and parse the file
     try:
         with config_path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
 
         # Validate structure
         if data is None:
@@ -73,15 +96,17 @@ def load_feeds() -> list[Feed]:
         if not isinstance(feeds_data, list):
             raise ValueError("'feeds' must be a list")
 
-        # Parse feeds into Feed objects
-        feeds = []
-        for feed_data in feeds_data:
-            try:
-                feed = Feed(**feed_data)
-                feeds.append(feed)
-            except Exception as e:
-                logger.warning(f"Invalid feed entry skipped: {e}")
-                continue
+        # Parse feeds into Feed objects: one compiled validator pass over the whole
+        # list, falling back to per-entry validation only to skip invalid entries
+        try:
+            feeds = _FEED_LIST_ADAPTER.validate_python(feeds_data)
+        except ValidationError:
+            feeds = []
+            for feed_data in feeds_data:
+                try:
+                    feeds.append(Feed.model_validate(feed_data))
+                except ValidationError as e:
+                    logger.warning(f"Invalid feed entry skipped: {e}")
 
         logger.info(f"Loaded {len(feeds)} feeds from config")
         return feeds
@@ -130,22 +155,18 @@ def save_feeds(feeds: list[Feed]) -> None:
         raise
 
     # Prepare data for YAML serialization
-    feeds_data = []
-    for feed in feeds:
-        feed_dict = feed.model_dump(mode="json")
-        # Convert HttpUrl to string for YAML serialization
-        feed_dict["url"] = str(feed_dict["url"])
-        feeds_data.append(feed_dict)
+    feeds_data = [_serialize_feed(feed) for feed in feeds]
 
     data = {"feeds": feeds_data}
 
     # Atomic write: write to temp file first, then rename
     try:
+        # newline="\n": identical bytes on every platform, as _read_appendable expects
         with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", delete=False, dir=config_path.parent
+            mode="w", encoding="utf-8", newline="\n", delete=False, dir=config_path.parent
         ) as tmp_file:
             tmp_path = Path(tmp_file.name)
-            yaml.safe_dump(data, tmp_file, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, tmp_file, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
 
         # Atomic rename
         shutil.move(str(tmp_path), str(config_path))
@@ -170,6 +191,116 @@ def save_feeds(feeds: list[Feed]) -> None:
         raise
 
 
+def append_feed(feed: Feed) -> None:
+    """Append a single feed to the configuration file.
+
+    See append_feeds for how the file is updated.
+
+    Args:
+        feed: Feed object to add. Its name should already be de-duplicated.
+
+    Raises:
+        ValueError: If feed is not a valid Feed object.
+        PermissionError: If file cannot be written due to permissions.
+        OSError: If file system error occurs.
+    """
+    append_feeds([feed])
+
+
+def append_feeds(feeds: list[Feed]) -> None:
+    """Append feeds to the configuration file in one write.
+
+    When the file is exactly in the block layout written by save_feeds ("feeds:"
+    as the only top-level key, followed by "- name: ..." entries), the new entries
+    are serialized on their own and added after the existing bytes, so no saved
+    feed is parsed or re-serialized. The result is written to a temporary file and
+    renamed over the config, so a crash mid-write never leaves a truncated file.
+    Any other layout (missing file, empty "feeds: []", indented lists, other
+    top-level keys or comments) falls back to a full rewrite through save_feeds.
+
+    Args:
+        feeds: Feed objects to add, in order. Names should already be de-duplicated.
+
+    Raises:
+        ValueError: If any feed is not a valid Feed object.
+        PermissionError: If file cannot be written due to permissions.
+        OSError: If file system error occurs.
+    """
+    for feed in feeds:
+        if not isinstance(feed, Feed):
+            raise ValueError(f"Invalid feed object: {feed}")
+    if not feeds:
+        return
+
+    config_path = get_config_path()
+    content = _read_appendable(config_path)
+    if content is None:
+        logger.debug("Config file is not in appendable layout, rewriting it")
+        save_feeds([*load_feeds(), *feeds])
+        return
+
+    entries = yaml.dump(
+        [_serialize_feed(feed) for feed in feeds],
+        Dumper=SafeDumper,
+        default_flow_style=False,
+        sort_keys=False,
+    )
+    tmp_path: Path | None = None
+    try:
+        with tempfile.NamedTemporaryFile(delete=False, dir=config_path.parent) as tmp_file:
+            tmp_path = Path(tmp_file.name)
+            tmp_file.write(content)
+            tmp_file.write(entries.encode("utf-8"))
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, config_path)
+        logger.info(f"Appended {len(feeds)} feed(s) to config")
+    except (PermissionError, OSError) as e:
+        logger.error(f"Failed to append feeds: {e}")
+        # Clean up temp file if it exists
+        if tmp_path is not None and tmp_path.exists():
+            try:
+                tmp_path.unlink()
+            except Exception:
+                pass
+        raise
+
+
+def _serialize_feed(feed: Feed) -> dict:
+    """Convert a Feed to a plain dictionary for YAML serialization."""
+    feed_dict = feed.model_dump(mode="json")
+    # Convert HttpUrl to string for YAML serialization
+    feed_dict["url"] = str(feed_dict["url"])
+    return feed_dict
+
+
+def _read_appendable(config_path: Path) -> bytes | None:
+    """Read the config file if new list entries can be added after its contents.
+
+    The file must be exactly in save_feeds' layout: a "feeds:" first line, then
+    only unindented "- " item lines and lines indented by two spaces, ending in a
+    newline. Anything else, such as a second top-level key, a comment, a blank
+    line or an indented list, rules the fast path out, since entries added after
+    it would not belong to the feeds list.
+
+    Args:
+        config_path: Path to the configuration file.
+
+    Returns:
+        The file contents if appending keeps the file valid, otherwise None.
+    """
+    try:
+        content = config_path.read_bytes()
+    except OSError:
+        return None
+
+    if not content.startswith(b"feeds:\n- ") or not content.endswith(b"\n"):
+        return None
+    if _FOREIGN_LINE_RE.search(content, len(b"feeds:")):
+        return None
+    return content
+
+
 def resolve_duplicate_name(name: str, existing_feeds: list[Feed]) -> str:
     """Resolve duplicate feed names by appending number suffix.
 
@@ -238,8 +369,8 @@ def _create_empty_config_file(config_path: Path) -> None:
     """
     try:
         empty_data: dict[str, list] = {"feeds": []}
-        with config_path.open("w", encoding="utf-8") as f:
-            yaml.safe_dump(empty_data, f, default_flow_style=False, sort_keys=False)
+        with config_path.open("w", encoding="utf-8", newline="\n") as f:
+            yaml.dump(empty_data, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
         logger.info("Created empty config file")
     except (PermissionError, OSError) as e:
         logger.error(f"Failed to create empty config file: {e}")
@@ -0,0 +1,170 @@
+"""Page cache for conditional re-fetches of previously scanned HTML pages.
+
+Stores the ETag / Last-Modified validators of each fetched page together with the
+stream candidates extracted from it, so a later fetch of the same URL can send a
+conditional GET and, on 304 Not Modified, reuse the candidates without downloading
+or parsing the page again.
+
+This module follows the library-first architecture principle and is independently testable.
+"""
+
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+from loguru import logger
+
+from pick_a_zoo.core.feed_discovery import StreamCandidate
+from pick_a_zoo.core.feed_manager import get_config_path
+from pick_a_zoo.core.yaml_io import SafeDumper, SafeLoader
+
+# Oldest entries are dropped beyond this many cached pages
+MAX_CACHED_PAGES = 64
+
+_cache_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPage:
+    """Validators and extracted streams recorded for a fetched page.
+
+    Attributes:
+        etag: ETag response header, if the server sent one
+        last_modified: Last-Modified response header, if the server sent one
+        candidates: Stream candidates extracted from the page
+    """
+
+    etag: str | None
+    last_modified: str | None
+    candidates: tuple[StreamCandidate, ...]
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build the request headers for a conditional GET.
+
+        Returns:
+            If-None-Match and/or If-Modified-Since headers
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def get_cache_path() -> Path:
+    """Get the path to the page cache file.
+
+    Returns:
+        Path: Path to page_cache.yaml next to the feeds configuration file.
+    """
+    return get_config_path().parent / "page_cache.yaml"
+
+
+def get_cached_page(url: str) -> CachedPage | None:
+    """Look up the cached validators and streams for a page.
+
+    Args:
+        url: Page URL
+
+    Returns:
+        CachedPage if the URL was cached with at least one validator, None otherwise.
+        A missing or unreadable cache file is treated as a miss.
+    """
+    with _cache_lock:
+        entry = _read_cache().get(url)
+    if not isinstance(entry, dict):
+        return None
+
+    try:
+        page = CachedPage(
+            etag=entry.get("etag"),
+            last_modified=entry.get("last_modified"),
+            candidates=tuple(
+                StreamCandidate(url=stream["url"], source_type=stream["source_type"])
+                for stream in entry.get("streams", [])
+            ),
+        )
+    except (KeyError, TypeError) as e:
+        logger.warning(f"Ignoring malformed page cache entry for {url}: {e}")
+        return None
+
+    if not (page.etag or page.last_modified):
+        return None
+    return page
+
+
+def store_cached_page(
+    url: str,
+    etag: str | None,
+    last_modified: str | None,
+    candidates: list[StreamCandidate],
+) -> None:
+    """Record the validators and extracted streams for a page.
+
+    Pages without an ETag or Last-Modified header cannot be revalidated and are not
+    stored. Failures to write the cache are logged and otherwise ignored.
+
+    Args:
+        url: Page URL
+        etag: ETag response header, if any
+        last_modified: Last-Modified response header, if any
+        candidates: Stream candidates extracted from the page
+    """
+    if not (etag or last_modified):
+        return
+
+    with _cache_lock:
+        cache = _read_cache()
+        # Re-insert so the entry moves to the end (most recently stored)
+        cache.pop(url, None)
+        cache[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "streams": [
+                {"url": candidate.url, "source_type": candidate.source_type}
+                for candidate in candidates
+            ],
+        }
+        while len(cache) > MAX_CACHED_PAGES:
+            del cache[next(iter(cache))]
+        _write_cache(cache)
+
+
+def _read_cache() -> dict:
+    """Read the cache file, returning an empty cache if it is missing or unreadable."""
+    cache_path = get_cache_path()
+    try:
+        with cache_path.open("r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=SafeLoader)
+    except FileNotFoundError:
+        return {}
+    except (OSError, yaml.YAMLError) as e:
+        logger.warning(f"Page cache unreadable, ignoring it: {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_cache(cache: dict) -> None:
+    """Write the cache file atomically; errors are logged, not raised."""
+    cache_path = get_cache_path()
+    tmp_path: Path | None = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w", encoding="utf-8", delete=False, dir=cache_path.parent
+        ) as tmp_file:
+            tmp_path = Path(tmp_file.name)
+            yaml.dump(cache, tmp_file, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+        os.replace(tmp_path, cache_path)
+    except (OSError, yaml.YAMLError) as e:
+        logger.warning(f"Failed to write page cache: {e}")
+        # Clean up temp file if it exists
+        if tmp_path is not None and tmp_path.exists():
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
@@ -5,8 +5,12 @@ It provides functionality to capture frames from video feeds and encode them int
 timelapse videos at 5x speed.
 """
 
+import functools
 import os
 import shutil
+import subprocess
+import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -18,6 +22,103 @@ from loguru import logger
 if TYPE_CHECKING:
     pass
 
+# Software H.264 encoder bundled with every ffmpeg build, used when no hardware encoder works
+_SOFTWARE_CODEC = "libx264"
+
+# Seconds a single hardware encoder probe may take before it is treated as unusable
+_PROBE_TIMEOUT_SECONDS = 2.0
+
+# Background thread running the one-per-process _pick_codec() probe
+_codec_probe_lock = threading.Lock()
+_codec_probe_thread: threading.Thread | None = None
+
+
+@functools.cache
+def _pick_codec() -> str:
+    """Pick the H.264 encoder for timelapse videos, preferring hardware encoders.
+
+    Each platform's hardware encoders are probed once per process by encoding a
+    single test frame with the bundled ffmpeg: an encoder can be compiled into
+    ffmpeg and still fail without the matching GPU or driver.
+
+    Returns:
+        Name of the first working hardware encoder, or libx264
+    """
+    if sys.platform == "darwin":
+        candidates = ("h264_videotoolbox",)
+    else:
+        candidates = ("h264_nvenc", "h264_qsv")
+
+    try:
+        import imageio_ffmpeg
+
+        ffmpeg = imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception as e:
+        logger.debug(f"ffmpeg not found for encoder probe, using {_SOFTWARE_CODEC}: {e}")
+        return _SOFTWARE_CODEC
+
+    for codec in candidates:
+        try:
+            probe = subprocess.run(
+                [
+                    ffmpeg,
+                    "-hide_banner",
+                    "-loglevel",
+                    "error",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "color=size=256x256:rate=1",
+                    "-frames:v",
+                    "1",
+                    "-c:v",
+                    codec,
+                    "-f",
+                    "null",
+                    "-",
+                ],
+                capture_output=True,
+                timeout=_PROBE_TIMEOUT_SECONDS,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug(f"Encoder probe for {codec} failed: {e}")
+            continue
+        if probe.returncode == 0:
+            logger.info(f"Using hardware encoder for timelapses: {codec}")
+            return codec
+
+    logger.debug(f"No hardware H.264 encoder available, using {_SOFTWARE_CODEC}")
+    return _SOFTWARE_CODEC
+
+
+def _start_codec_probe() -> None:
+    """Start the _pick_codec() probe on a background thread, once per process."""
+    global _codec_probe_thread
+    with _codec_probe_lock:
+        if _codec_probe_thread is None:
+            _codec_probe_thread = threading.Thread(
+                target=_pick_codec, name="CodecProbe", daemon=True
+            )
+            _codec_probe_thread.start()
+
+
+def _ready_codec() -> str:
+    """Return the probed encoder without waiting on the probe.
+
+    stop_recording() runs on the GUI thread, so a probe that is still running
+    (e.g. a hung driver) must not block it: libx264 is used for that encode.
+
+    Returns:
+        The codec chosen by _pick_codec() if the probe has finished, otherwise libx264
+    """
+    _start_codec_probe()
+    with _codec_probe_lock:
+        probe = _codec_probe_thread
+    if probe is not None and probe.is_alive():
+        logger.debug(f"Encoder probe still running, using {_SOFTWARE_CODEC}")
+        return _SOFTWARE_CODEC
+    return _pick_codec()
+
 
 class TimelapseEncoderError(Exception):
     """Base exception for timelapse encoder errors."""
@@ -176,6 +277,9 @@ class TimelapseEncoder:
         if source_fps <= 0:
             raise ValueError("source_fps must be positive")
 
+        # Probe hardware encoders while recording, so stop_recording() never waits on it
+        _start_codec_probe()
+
         self._feed_name = feed_name.strip()
         self._source_fps = source_fps
         self._output_fps = source_fps * 5.0
@@ -188,11 +292,14 @@ class TimelapseEncoder:
             f"source_fps={self._source_fps:.1f}, output_fps={self._output_fps:.1f}"
         )
 
-    def capture_frame(self, frame: np.ndarray) -> None:
+    def capture_frame(self, frame: np.ndarray, *, copy: bool = True) -> None:
         """Capture a frame from the video feed and add it to the recording buffer.
 
         Args:
             frame: Video frame as numpy array with shape (height, width, 3) for RGB
+            copy: Buffer a copy of the frame (default). Pass False to hand over a
+                freshly allocated array the caller will not modify again; a
+                C-contiguous frame is then buffered as-is, saving a full-frame copy
 
         Raises:
             NoRecordingError: If no recording is in progress
@@ -221,8 +328,8 @@ class TimelapseEncoder:
         if frame.dtype != np.uint8:
             raise ValueError(f"frame must be uint8 dtype, got {frame.dtype}")
 
-        # Add frame to buffer
-        self._frames.append(frame.copy())
+        # Add frame to buffer; the encoder needs C-contiguous data either way
+        self._frames.append(frame.copy() if copy else np.ascontiguousarray(frame))
         logger.debug(f"Captured frame {len(self._frames)}")
 
     def stop_recording(self) -> Path:
@@ -376,18 +483,34 @@ class TimelapseEncoder:
         Behavior:
             - Encodes frames using imageio-ffmpeg
             - Sets output fps to 5x source fps
-            - Uses H.264 codec for compatibility
+            - Uses a hardware H.264 encoder when one works, otherwise libx264
+            - Retries with libx264 if the hardware encoder fails mid-encode
         """
         if len(self._frames) == 0:
             raise ValueError("No frames to encode")
 
+        codec = _ready_codec()
+        if codec != _SOFTWARE_CODEC:
+            try:
+                self._write_video(output_path, codec)
+                return
+            except EncodingError as e:
+                logger.warning(f"{codec} encoding failed, retrying with {_SOFTWARE_CODEC}: {e}")
+        self._write_video(output_path, _SOFTWARE_CODEC)
+
+    def _write_video(self, output_path: Path, codec: str) -> None:
+        """Write the buffered frames to output_path with the given ffmpeg codec.
+
+        Raises:
+            EncodingError: If encoding fails (any partial file is removed)
+        """
         try:
             # Use imageio with ffmpeg plugin for MP4 encoding
             # imageio-ffmpeg plugin is automatically used when available
             writer = imageio.get_writer(
                 str(output_path),
                 fps=self._output_fps,
-                codec="libx264",
+                codec=codec,
                 quality=8,  # Good quality (0-10 scale)
                 pixelformat="yuv420p",  # Compatible format
             )
@@ -397,6 +520,10 @@ class TimelapseEncoder:
                 writer.append_data(frame)
 
             writer.close()
+
+            # imageio only logs ffmpeg failures such as an unknown encoder
+            if not output_path.exists() or output_path.stat().st_size == 0:
+                raise RuntimeError(f"ffmpeg produced no output with codec {codec}")
         except Exception as e:
             logger.error(f"Video encoding error: {e}")
             # Clean up partial file if it exists
@@ -5,6 +5,7 @@ It wraps ffpyplayer to provide a clean interface for loading streams, controllin
 handling errors, and extracting frames.
 """
 
+import threading
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -97,6 +98,8 @@ class VideoPlayer:
         self._player: Any = None
         self._is_playing = False
         self._error: VideoPlayerError | None = None
+        # Seconds until the next frame is due, as ffpyplayer last reported it
+        self._frame_delay: float | None = None
 
     def load(self) -> None:
         """Load the video stream and prepare for playback.
@@ -125,8 +128,9 @@ class VideoPlayer:
             self._error = None
 
             # Create MediaPlayer instance
-            # ffpyplayer.MediaPlayer handles stream loading
-            self._player = MediaPlayer(self.stream_url)
+            # ffpyplayer.MediaPlayer handles stream loading; pin the output pixel format
+            # to packed rgb24 so frames always arrive in the layout QImage expects
+            self._player = MediaPlayer(self.stream_url, ff_opts={"out_fmt": "rgb24"})
             logger.debug("Stream loaded successfully")
         except ImportError as e:
             error_msg = "ffpyplayer not available"
@@ -247,6 +251,9 @@ class VideoPlayer:
             img, pts = frame_data
 
             if img is None:
+                # With no frame, the second value is the wait until the next one is
+                # due, or a "paused" / "eof" marker
+                self._frame_delay = pts if isinstance(pts, float) else None
                 return None
 
             # Handle different ffpyplayer return formats
@@ -495,6 +502,16 @@ class VideoPlayer:
                 self._is_playing = False
             return None
 
+    def get_frame_delay(self) -> float | None:
+        """Get how long to wait before asking for the next frame.
+
+        Returns:
+            Seconds ffpyplayer reported until the next frame is due, from the last
+            get_frame() call that returned no frame; None if unknown (paused, end of
+            stream, or no such call yet)
+        """
+        return self._frame_delay
+
     def is_playing(self) -> bool:
         """Check if video is currently playing.
 
@@ -514,3 +531,109 @@ class VideoPlayer:
             - Error cleared when new operation succeeds
         """
         return self._error
+
+
+class FrameProducer:
+    """Background producer that pulls frames from a VideoPlayer off the GUI thread.
+
+    Holds at most one decoded frame (the newest) at a time. After publishing a frame
+    the producer waits until the consumer calls mark_ready() before fetching the next
+    one, so a consumer that falls behind causes frames to be dropped by the decoder
+    instead of queued without bound.
+    """
+
+    # Bounds for the decoder-reported wait between polls while no frame is ready
+    MIN_POLL_INTERVAL = 0.002
+    MAX_POLL_INTERVAL = 0.1
+
+    def __init__(self, player: VideoPlayer, idle_interval: float = 0.02) -> None:
+        """Initialize the producer for a loaded video player.
+
+        Args:
+            player: VideoPlayer to pull frames from (should already be playing)
+            idle_interval: Seconds to wait before polling again when no frame is ready
+                and the decoder gave no delay, e.g. while paused (default: 0.02)
+
+        Side Effects:
+            None (thread not started until start() called)
+        """
+        self._player = player
+        self._idle_interval = idle_interval
+        self._lock = threading.Lock()
+        self._latest: VideoFrame | None = None
+        self._ready_for_next = threading.Event()
+        self._ready_for_next.set()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the producer thread. Has no effect if already running."""
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="FrameProducer", daemon=True)
+        self._thread.start()
+        logger.debug("Frame producer started")
+
+    def stop(self, timeout: float = 1.0) -> bool:
+        """Stop the producer thread and discard any pending frame.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread to exit (default: 1.0)
+
+        Returns:
+            True if the thread has exited; False if it is still inside
+            player.get_frame(), in which case the player must not be stopped yet
+        """
+        self._stop_event.set()
+        # Unblock a producer waiting for the consumer
+        self._ready_for_next.set()
+        with self._lock:
+            self._latest = None
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logger.warning(f"Frame producer still running after {timeout}s")
+                return False
+            self._thread = None
+        logger.debug("Frame producer stopped")
+        return True
+
+    def take_frame(self) -> VideoFrame | None:
+        """Take the pending frame, if any.
+
+        Returns:
+            The newest decoded VideoFrame, or None if no frame is pending
+        """
+        with self._lock:
+            frame, self._latest = self._latest, None
+        return frame
+
+    def mark_ready(self) -> None:
+        """Signal that the consumer has finished with the last frame."""
+        self._ready_for_next.set()
+
+    def _run(self) -> None:
+        """Producer loop: fetch one frame, publish it, wait for the consumer."""
+        while not self._stop_event.is_set():
+            if not self._ready_for_next.wait(timeout=0.1):
+                continue
+            if self._stop_event.is_set():
+                break
+
+            frame = self._player.get_frame()
+            if frame is None:
+                self._stop_event.wait(self._poll_interval())
+                continue
+
+            with self._lock:
+                self._latest = frame
+            self._ready_for_next.clear()
+
+    def _poll_interval(self) -> float:
+        """Seconds to wait after get_frame() returned no frame."""
+        delay = self._player.get_frame_delay()
+        if not isinstance(delay, float):
+            return self._idle_interval
+        return min(max(delay, self.MIN_POLL_INTERVAL), self.MAX_POLL_INTERVAL)
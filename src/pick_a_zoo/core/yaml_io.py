@@ -0,0 +1,13 @@
+"""YAML loader and dumper selection shared by the modules that persist YAML files.
+
+This module follows the library-first architecture principle and is independently testable.
+"""
+
+# Prefer the libyaml C loader/dumper; fall back to pure Python if PyYAML was built without it
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+__all__ = ["SafeDumper", "SafeLoader"]
@@ -16,6 +16,7 @@ from pick_a_zoo.core.video_player import (
     MAX_WINDOW_WIDTH,
     MIN_WINDOW_HEIGHT,
     MIN_WINDOW_WIDTH,
+    FrameProducer,
     StreamLoadError,
     VideoPlayer,
     VideoPlayerError,
@@ -96,8 +97,11 @@ class VideoWindow:
             self.error_label.hide()
             layout.addWidget(self.error_label)
 
-            # Initialize video player
+            # Initialize video player and background frame producer
             self._player: VideoPlayer | None = None
+            self._frame_producer: FrameProducer | None = None
+            # Set once the first frame has been displayed
+            self._first_frame_shown = False
 
             # Initialize timelapse encoder
             self._timelapse_encoder: TimelapseEncoder | None = None
@@ -169,6 +173,10 @@ class VideoWindow:
             self._player.play()
             logger.info("Playback started")
 
+            # Decode frames off the GUI thread, keeping at most one frame in flight
+            self._frame_producer = FrameProducer(self._player)
+            self._frame_producer.start()
+
             # Start frame update timer
             self._start_frame_timer()
             logger.info("Frame update timer started")
@@ -182,11 +190,17 @@ class VideoWindow:
     def _start_frame_timer(self) -> None:
         """Start timer to update video frames."""
         try:
-            from PyQt6.QtCore import QTimer
+            from PyQt6.QtCore import Qt, QTimer
+            from PyQt6.QtGui import QImage
 
             if self._player is None:
                 return
 
+            # Cache enum values used on every frame (avoids two-level PyQt6 enum lookups)
+            self._fmt_rgb888 = QImage.Format.Format_RGB888
+            self._keep_aspect_ratio = Qt.AspectRatioMode.KeepAspectRatio
+            self._smooth_transform = Qt.TransformationMode.SmoothTransformation
+
             timer = QTimer(self._window)
             timer.timeout.connect(self._update_frame)
             timer.start(33)  # ~30 FPS (33ms per frame)
@@ -205,7 +219,10 @@ class VideoWindow:
             return
 
         try:
-            frame = self._player.get_frame()
+            if self._frame_producer is not None:
+                frame = self._frame_producer.take_frame()
+            else:
+                frame = self._player.get_frame()
             if frame is None:
                 # First time we get None, log it for diagnostics
                 if not hasattr(self, "_frame_none_count"):
@@ -234,7 +251,6 @@ class VideoWindow:
             # Convert frame to QPixmap and display
             # ffpyplayer returns numpy array, convert to QImage
             import numpy as np
-            from PyQt6.QtCore import Qt
             from PyQt6.QtGui import QImage, QPixmap
 
             # Handle different image formats
@@ -401,16 +417,15 @@ class VideoWindow:
                 # ffpyplayer typically uses RGB format
                 if len(img.shape) == 3:
                     bytes_per_line = width * 3
-                    # Ensure we have contiguous array for QImage
-                    if not img.flags["C_CONTIGUOUS"]:
-                        img = np.ascontiguousarray(img)
+                    # VideoPlayer pins the decoder output to packed rgb24, so frames are
+                    # C-contiguous; validate that once on the first frame only
+                    if not self._first_frame_shown and not img.flags.c_contiguous:
+                        logger.warning("Decoded frame is not C-contiguous; check decoder output")
 
                     # Convert numpy array to bytes for QImage
                     # QImage constructor expects bytes, not numpy array buffer
                     img_bytes = img.tobytes()
-                    qimage = QImage(
-                        img_bytes, width, height, bytes_per_line, QImage.Format.Format_RGB888
-                    )
+                    qimage = QImage(img_bytes, width, height, bytes_per_line, self._fmt_rgb888)
                     if qimage.isNull():
                         logger.error("Failed to create QImage from frame data")
                         return
@@ -422,8 +437,8 @@ class VideoWindow:
 
                     scaled_pixmap = pixmap.scaled(
                         self.video_label.size(),
-                        aspectRatioMode=Qt.AspectRatioMode.KeepAspectRatio,
-                        transformMode=Qt.TransformationMode.SmoothTransformation,
+                        aspectRatioMode=self._keep_aspect_ratio,
+                        transformMode=self._smooth_transform,
                     )
                     self.video_label.setPixmap(scaled_pixmap)
 
@@ -453,14 +468,17 @@ class VideoWindow:
                                     if frame_array.ndim == 3 and frame_array.shape[2] == 3:
                                         self._timelapse_encoder.capture_frame(frame_array)
                                     elif frame_array.ndim == 2:
-                                        # Grayscale, convert to RGB
+                                        # Grayscale, convert to RGB; the stacked array
+                                        # is ours, so the encoder can keep it uncopied
                                         frame_array = np.stack([frame_array] * 3, axis=2)
-                                        self._timelapse_encoder.capture_frame(frame_array)
+                                        self._timelapse_encoder.capture_frame(
+                                            frame_array, copy=False
+                                        )
                         except Exception as e:
                             logger.warning(f"Error capturing frame for timelapse: {e}")
 
                     # Log first successful frame
-                    if not hasattr(self, "_first_frame_shown"):
+                    if not self._first_frame_shown:
                         logger.info("First frame displayed successfully")
                         self._first_frame_shown = True
                 else:
@@ -474,6 +492,10 @@ class VideoWindow:
                 )
         except Exception as e:
             logger.warning(f"Error updating frame: {e}", exc_info=True)
+        finally:
+            # Let the producer fetch the next frame once this one has been handled
+            if self._frame_producer is not None:
+                self._frame_producer.mark_ready()
 
     def closeEvent(self, event: QCloseEvent | None) -> None:  # noqa: N802
         """Handle window close event.
@@ -510,9 +532,19 @@ class VideoWindow:
             except Exception as e:
                 logger.warning(f"Error stopping timelapse recording on close: {e}")
 
-        # Stop video player
+        # Stop frame producer before releasing the player it reads from
+        producer_stopped = True
+        if self._frame_producer is not None:
+            producer_stopped = self._frame_producer.stop()
+            self._frame_producer = None
+
+        # Stop video player, unless the producer thread may still be decoding from it;
+        # the player is then released when that thread drops its last reference
         if self._player:
-            self._player.stop()
+            if producer_stopped:
+                self._player.stop()
+            else:
+                logger.warning("Frame producer did not exit; leaving video player open")
             self._player = None
 
         # Stop frame timer
@@ -1,7 +1,10 @@
 """TUI Application root for Pick-a-Zoo."""
 
+from loguru import logger
 from textual.app import App
 
+from pick_a_zoo.core.feed_manager import get_config_mtime_ns, load_feeds
+from pick_a_zoo.core.models import Feed
 from pick_a_zoo.tui.screens.main_menu import MainMenuScreen
 
 
@@ -13,8 +16,24 @@ class PickAZooApp(App):
         ("escape", "quit", "Quit"),
     ]
 
+    def __init__(self) -> None:
+        """Initialize PickAZooApp."""
+        super().__init__()
+        # In-memory copy of the saved feeds: loaded once at startup, replaced after each save
+        self.feeds: list[Feed] = []
+        # Config file mtime that self.feeds was loaded from; None if unknown
+        self.feeds_mtime_ns: int | None = None
+
     def on_mount(self) -> None:
         """Called when app starts. Loads feeds and displays main menu."""
+        try:
+            # Stat before reading so a concurrent edit shows up as a newer mtime
+            mtime_ns = get_config_mtime_ns()
+            self.feeds = load_feeds()
+            self.feeds_mtime_ns = mtime_ns
+        except Exception as e:
+            logger.error(f"Failed to load feeds: {e}", exc_info=True)
+            self.feeds = []
         self.push_screen(MainMenuScreen())
 
     async def action_quit(self) -> None:
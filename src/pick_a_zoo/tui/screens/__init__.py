@@ -1,7 +1,28 @@
 """TUI screen components for Pick-a-Zoo."""
 
-from pick_a_zoo.tui.screens.add_feed import AddFeedScreen
-from pick_a_zoo.tui.screens.main_menu import MainMenuScreen
-from pick_a_zoo.tui.screens.view_saved_cams import ViewSavedCamsScreen
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pick_a_zoo.tui.screens.add_feed import AddFeedScreen
+    from pick_a_zoo.tui.screens.main_menu import MainMenuScreen
+    from pick_a_zoo.tui.screens.view_saved_cams import ViewSavedCamsScreen
 
 __all__ = ["AddFeedScreen", "MainMenuScreen", "ViewSavedCamsScreen"]
+
+# Screens are imported on first access, so launching the TUI does not pull in the
+# feed discovery stack (httpx, lxml, Playwright) until the Add screen is opened,
+# nor the saved cams list until it is viewed.
+_SCREEN_MODULES = {
+    "AddFeedScreen": "pick_a_zoo.tui.screens.add_feed",
+    "MainMenuScreen": "pick_a_zoo.tui.screens.main_menu",
+    "ViewSavedCamsScreen": "pick_a_zoo.tui.screens.view_saved_cams",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import a screen class lazily on first attribute access."""
+    module_name = _SCREEN_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
@@ -1,24 +1,89 @@
 """Add feed screen for Pick-a-Zoo TUI."""
 
+import hashlib
+import queue
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, cast
+
 import httpx
 from loguru import logger
-from textual import on
+from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical
 from textual.screen import Screen
 from textual.widgets import Input, Label, ListItem, ListView, Static
+from textual.worker import get_current_worker
 
 from pick_a_zoo.core.feed_discovery import (
+    MAX_STREAM_CANDIDATES,
     FeedDiscoveryError,
     HTMLParseError,
+    HTMLStreamExtractor,
+    StreamCandidate,
     URLType,
     URLValidationError,
     detect_url_type,
     extract_streams_from_html,
+    get_browser_headers,
+    get_http_client,
     validate_url_accessibility,
 )
-from pick_a_zoo.core.feed_manager import load_feeds, resolve_duplicate_name, save_feeds
+from pick_a_zoo.core.feed_manager import append_feeds, resolve_duplicate_name
 from pick_a_zoo.core.models import DEFAULT_WINDOW_SIZE, Feed
+from pick_a_zoo.core.page_cache import get_cached_page, store_cached_page
+
+if TYPE_CHECKING:
+    from pick_a_zoo.tui.app import PickAZooApp
+
+
+def _describe_http_status(error: httpx.HTTPStatusError) -> str:
+    """User message for an HTTP error status."""
+    if error.response.status_code == 403:
+        return (
+            "Access denied (403 Forbidden). "
+            "The site may be blocking automated requests. "
+            "Browser automation (Playwright) was attempted but failed. "
+            "Try accessing the page in a browser first, "
+            "or provide a direct stream URL instead. "
+            "Press 'q' to cancel."
+        )
+    return (
+        f"Failed to fetch page: HTTP {error.response.status_code}. "
+        "Please check the URL and try again, or press 'q' to cancel."
+    )
+
+
+# Page fetch failures: (exception type, log prefix, user message builder), first match wins
+_FETCH_ERRORS: tuple[tuple[type[Exception], str, Callable[[Any], str]], ...] = (
+    (httpx.HTTPStatusError, "HTTP error fetching HTML", _describe_http_status),
+    (
+        httpx.TimeoutException,
+        "Timeout fetching HTML",
+        lambda error: (
+            "Request timed out while fetching the page. "
+            "Please check your connection and try again, or press 'q' to cancel."
+        ),
+    ),
+    (
+        httpx.RequestError,
+        "Network error fetching HTML",
+        lambda error: (
+            f"Network error: {error}. "
+            "Please check your connection and try again, or press 'q' to cancel."
+        ),
+    ),
+    (
+        HTMLParseError,
+        "HTML parse error",
+        lambda error: (
+            f"Failed to parse HTML page: {error.user_message or str(error)}. "
+            "Please try a different URL or provide a direct stream URL, "
+            "or press 'q' to cancel."
+        ),
+    ),
+)
 
 
 class AddFeedScreen(Screen):
@@ -29,6 +94,9 @@ class AddFeedScreen(Screen):
         ("q", "cancel", "Cancel"),
     ]
 
+    # Delay before writing feeds, so saves issued in quick succession coalesce
+    PERSIST_DEBOUNCE_SECONDS = 0.1
+
     def __init__(self) -> None:
         """Initialize AddFeedScreen."""
         super().__init__()
@@ -37,6 +105,15 @@ class AddFeedScreen(Screen):
         self.current_state: str = "name_input"  # name_input, url_input, stream_selection, error
         self.stream_candidates: list = []
         self.error_message: str | None = None
+        # Extraction results keyed by (page URL, content digest)
+        self._parse_cache: dict[tuple[str, str], list[StreamCandidate]] = {}
+        # Text currently shown in the status message
+        self._status_text: str | None = None
+        # Labels currently mounted in the stream list
+        self._stream_labels: tuple[str, ...] = ()
+        # Feeds added to app.feeds but not yet written; drained by _persist_feeds
+        self._pending_feeds: list[Feed] = []
+        self._pending_lock = threading.Lock()
 
     def compose(self) -> ComposeResult:
         """Compose the screen layout."""
@@ -53,60 +130,75 @@ class AddFeedScreen(Screen):
     def on_mount(self) -> None:
         """Called when screen is mounted. Initializes screen state and displays name prompt."""
         logger.info("AddFeedScreen mounted")
+        # Look the widgets up once; every state change reuses these references
+        self._w_status = self.query_one("#status-message", Static)
+        self._w_url_prompt = self.query_one("#url-prompt", Static)
+        self._w_name_input = self.query_one("#name-input", Input)
+        self._w_url_input = self.query_one("#url-input", Input)
+        self._w_error = self.query_one("#error-message", Static)
+        self._w_stream_list = self.query_one("#stream-list", ListView)
         self._update_display()
         # Focus on name input
-        name_input = self.query_one("#name-input", Input)
-        name_input.focus()
+        self._w_name_input.focus()
 
     def _update_display(self) -> None:
         """Update screen display based on current state."""
-        status_widget = self.query_one("#status-message", Static)
-        url_prompt = self.query_one("#url-prompt", Static)
-        name_input = self.query_one("#name-input", Input)
-        url_input = self.query_one("#url-input", Input)
-        error_widget = self.query_one("#error-message", Static)
-        stream_list = self.query_one("#stream-list", ListView)
+        url_prompt = self._w_url_prompt
+        name_input = self._w_name_input
+        url_input = self._w_url_input
+        error_widget = self._w_error
+        stream_list = self._w_stream_list
 
         if self.current_state == "name_input":
-            status_widget.update("Enter a name for this feed:")
+            self._set_status("Enter a name for this feed:")
             url_prompt.update("")
             name_input.disabled = False
             url_input.disabled = True
             error_widget.update("")
             stream_list.disabled = True
         elif self.current_state == "url_input":
-            status_widget.update(f"Feed name: {self.feed_name}")
+            self._set_status(f"Feed name: {self.feed_name}")
             url_prompt.update("Enter the URL for this feed:")
             name_input.disabled = True
             url_input.disabled = False
             error_widget.update("")
             stream_list.disabled = True
         elif self.current_state == "stream_selection":
-            status_widget.update(f"Feed name: {self.feed_name}")
+            self._set_status(f"Feed name: {self.feed_name}")
             url_prompt.update(f"Found {len(self.stream_candidates)} streams. Select one:")
             name_input.disabled = True
             url_input.disabled = True
             error_widget.update("")
             stream_list.disabled = False
-            self._populate_stream_list()
+            self.call_later(self._populate_stream_list)
         elif self.current_state == "error":
-            status_widget.update(f"Feed name: {self.feed_name}")
+            self._set_status(f"Feed name: {self.feed_name}")
             url_prompt.update("")
             name_input.disabled = True
             url_input.disabled = True
             error_widget.update(self.error_message or "An error occurred")
             stream_list.disabled = True
 
-    def _populate_stream_list(self) -> None:
-        """Populate stream list with candidates."""
-        stream_list = self.query_one("#stream-list", ListView)
-        stream_list.clear()
-        for idx, candidate in enumerate(self.stream_candidates):
-            stream_list.append(
-                ListItem(
-                    Label(f"{idx + 1}. {candidate.url} ({candidate.source_type})"),
-                    id=f"stream-{idx}",
-                )
+    async def _populate_stream_list(self) -> None:
+        """Populate stream list with candidates.
+
+        The old items are removed before the new ones are mounted so that a second
+        search does not collide with the previous "stream-{idx}" IDs.
+        """
+        labels = tuple(
+            f"{idx + 1}. {candidate.url} ({candidate.source_type})"
+            for idx, candidate in enumerate(self.stream_candidates)
+        )
+        if labels == self._stream_labels:
+            # Same candidates already on screen: keep the mounted items
+            return
+        self._stream_labels = labels
+
+        stream_list = self._w_stream_list
+        with self.app.batch_update():
+            await stream_list.clear()
+            await stream_list.extend(
+                ListItem(Label(text), id=f"stream-{idx}") for idx, text in enumerate(labels)
             )
 
     @on(Input.Submitted, "#name-input")
@@ -114,8 +206,7 @@ class AddFeedScreen(Screen):
         """Handle name input submission."""
         name = event.value.strip()
         if not name:
-            error_widget = self.query_one("#error-message", Static)
-            error_widget.update("Feed name cannot be empty. Please enter a name.")
+            self._w_error.update("Feed name cannot be empty. Please enter a name.")
             return
 
         self.feed_name = name
@@ -123,25 +214,31 @@ class AddFeedScreen(Screen):
         self.current_state = "url_input"
         self._update_display()
         # Focus on URL input
-        url_input = self.query_one("#url-input", Input)
-        url_input.focus()
+        self._w_url_input.focus()
 
     @on(Input.Submitted, "#url-input")
     def on_url_submitted(self, event: Input.Submitted) -> None:
         """Handle URL input submission."""
         url = event.value.strip()
         if not url:
-            error_widget = self.query_one("#error-message", Static)
-            error_widget.update("URL cannot be empty. Please enter a URL.")
+            self._w_error.update("URL cannot be empty. Please enter a URL.")
             return
 
         self.feed_url = url
         logger.info(f"URL entered: {self.feed_url}")
 
         # Update status to show validation in progress
-        status_widget = self.query_one("#status-message", Static)
-        status_widget.update("Validating URL...")
+        self._set_status("Validating URL...")
+
+        # Network I/O runs in a worker thread so the UI stays responsive
+        self._run_url_validation(url)
 
+    @work(exclusive=True, thread=True)
+    def _run_url_validation(self, url: str) -> None:
+        """Detect, validate and fetch the submitted URL off the UI thread.
+
+        All widget updates are posted back to the UI thread via call_from_thread.
+        """
         try:
             # Detect URL type
             url_type = detect_url_type(url)
@@ -151,226 +248,294 @@ class AddFeedScreen(Screen):
                 validation_result = validate_url_accessibility(url)
                 if validation_result.is_accessible:
                     # Create and save feed
-                    self._save_direct_stream_feed(url)
+                    self.app.call_from_thread(self._save_direct_stream_feed, url)
                 else:
                     # Show error and allow retry
-                    self.current_state = "error"
                     error_msg = validation_result.error_message or "Unknown error"
-                    self.error_message = (
+                    self.app.call_from_thread(
+                        self._show_error,
                         f"URL is not accessible: {error_msg}. "
-                        "Please check the URL and try again, or press 'q' to cancel."
+                        "Please check the URL and try again, or press 'q' to cancel.",
                     )
-                    self._update_display()
             else:
                 # HTML page - fetch and extract streams
                 self._handle_html_page(url)
 
         except URLValidationError as e:
             logger.error(f"URL validation error: {e}")
-            self.current_state = "error"
-            self.error_message = (
+            self.app.call_from_thread(
+                self._show_error,
                 f"Error validating URL: {e.user_message or str(e)}. "
-                "Please check your connection and try again, or press 'q' to cancel."
+                "Please check your connection and try again, or press 'q' to cancel.",
             )
-            self._update_display()
         except FeedDiscoveryError as e:
             logger.error(f"Feed discovery error: {e}")
-            self.current_state = "error"
-            self.error_message = (
+            self.app.call_from_thread(
+                self._show_error,
                 f"Error detecting URL type: {e.user_message or str(e)}. "
-                "Please check the URL and try again, or press 'q' to cancel."
+                "Please check the URL and try again, or press 'q' to cancel.",
             )
-            self._update_display()
         except Exception as e:
             logger.error(f"Unexpected error: {e}", exc_info=True)
-            self.current_state = "error"
-            self.error_message = (
-                f"An unexpected error occurred: {e}. " "Please try again or press 'q' to cancel."
+            self.app.call_from_thread(
+                self._show_error,
+                f"An unexpected error occurred: {e}. Please try again or press 'q' to cancel.",
             )
-            self._update_display()
 
     def _handle_html_page(self, url: str) -> None:
-        """Handle HTML page URL: fetch content and extract streams."""
-        status_widget = self.query_one("#status-message", Static)
-        status_widget.update("Fetching HTML page...")
+        """Handle HTML page URL: fetch content and extract streams.
 
-        try:
-            # Fetch HTML content with browser-like headers to avoid bot detection
-            from pick_a_zoo.core.feed_discovery import _get_browser_headers
+        Strategies run in a fixed order: a plain HTTP fetch, then (on 403 only) the
+        Playwright / 403 body race. Any other failure is mapped to a user message by
+        _report_fetch_error.
 
-            headers = _get_browser_headers(url)
-            with httpx.Client(timeout=30.0, follow_redirects=True, headers=headers) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                html_content = response.text
-
-            logger.info(f"Fetched HTML content from {url} ({len(html_content)} bytes)")
-
-            # Extract streams from HTML
-            status_widget.update("Extracting streams from page...")
-            self.stream_candidates = extract_streams_from_html(html_content, url)
-
-            # Handle results
-            if len(self.stream_candidates) == 0:
-                # No streams found
-                self.current_state = "error"
-                self.error_message = (
-                    "No playable streams found on this page. "
-                    "Please try a different URL or provide a direct stream URL, "
-                    "or press 'q' to cancel."
-                )
-                self._update_display()
-            elif len(self.stream_candidates) == 1:
-                # Single stream - auto-select and save
-                logger.info(f"Single stream found, auto-selecting: {self.stream_candidates[0].url}")
-                self._save_direct_stream_feed(self.stream_candidates[0].url)
-            else:
-                # Multiple streams - show selection list
-                logger.info(f"Found {len(self.stream_candidates)} streams, showing selection list")
-                self.current_state = "stream_selection"
-                self._update_display()
-                # Focus on stream list for keyboard navigation
-                stream_list = self.query_one("#stream-list", ListView)
-                stream_list.focus()
+        Runs in the URL validation worker thread.
+        """
+        self.app.call_from_thread(self._set_status, "Fetching HTML page...")
 
+        try:
+            candidates = self._fetch_streams_with_httpx(url)
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error fetching HTML: {e}")
-            # Try Playwright as fallback for 403 errors
-            if e.response.status_code == 403:
-                try:
-                    from pick_a_zoo.core.feed_discovery import fetch_html_with_playwright
-
-                    status_widget.update("Access denied. Trying with browser automation...")
-                    logger.info("403 error detected, attempting Playwright fallback")
-                    html_content = fetch_html_with_playwright(url, timeout=30.0)
-
-                    # Extract streams from Playwright-fetched HTML
-                    status_widget.update("Extracting streams from page...")
-                    self.stream_candidates = extract_streams_from_html(html_content, url)
-
-                    if len(self.stream_candidates) > 0:
-                        # Found streams with Playwright!
-                        if len(self.stream_candidates) == 1:
-                            stream_url = self.stream_candidates[0].url
-                            logger.info(
-                                f"Single stream found with Playwright, "
-                                f"auto-selecting: {stream_url}"
-                            )
-                            self._save_direct_stream_feed(stream_url)
-                            return
-                        else:
-                            logger.info(
-                                f"Found {len(self.stream_candidates)} streams "
-                                "with Playwright, showing selection"
-                            )
-                            self.current_state = "stream_selection"
-                            self._update_display()
-                            stream_list = self.query_one("#stream-list", ListView)
-                            stream_list.focus()
-                            return
-                    else:
-                        # Playwright worked but no streams found
-                        self.current_state = "error"
-                        self.error_message = (
-                            "Page loaded successfully but no playable streams were found. "
-                            "The page may not contain embedded video streams, "
-                            "or they may be loaded dynamically. "
-                            "Please try a direct stream URL instead, "
-                            "or press 'q' to cancel."
-                        )
-                        self._update_display()
-                        return
-
-                except Exception as playwright_error:
-                    logger.warning(f"Playwright fallback failed: {playwright_error}")
-                    # Fall through to error message below
-
-            # Try to extract streams from error page HTML anyway
-            # (some sites return HTML even on 403)
-            if e.response.status_code == 403:
-                try:
-                    html_content = e.response.text
-                    logger.info(
-                        f"Attempting stream extraction from 403 response "
-                        f"({len(html_content)} bytes)"
-                    )
-                    self.stream_candidates = extract_streams_from_html(html_content, url)
-                    if len(self.stream_candidates) > 0:
-                        # Found streams despite 403!
-                        if len(self.stream_candidates) == 1:
-                            stream_url = self.stream_candidates[0].url
-                            logger.info(
-                                f"Single stream found despite 403, " f"auto-selecting: {stream_url}"
-                            )
-                            self._save_direct_stream_feed(stream_url)
-                            return
-                        else:
-                            logger.info(
-                                f"Found {len(self.stream_candidates)} streams "
-                                "despite 403, showing selection"
-                            )
-                            self.current_state = "stream_selection"
-                            self._update_display()
-                            stream_list = self.query_one("#stream-list", ListView)
-                            stream_list.focus()
-                            return
-                except Exception as parse_error:
-                    logger.warning(f"Failed to parse 403 response: {parse_error}")
-
-            # No streams found or parsing failed
-            self.current_state = "error"
-            if e.response.status_code == 403:
-                self.error_message = (
-                    "Access denied (403 Forbidden). "
-                    "The site may be blocking automated requests. "
-                    "Browser automation (Playwright) was attempted but failed. "
-                    "Try accessing the page in a browser first, "
-                    "or provide a direct stream URL instead. "
-                    "Press 'q' to cancel."
-                )
-            else:
-                self.error_message = (
-                    f"Failed to fetch page: HTTP {e.response.status_code}. "
-                    "Please check the URL and try again, or press 'q' to cancel."
-                )
-            self._update_display()
-        except httpx.TimeoutException as e:
-            logger.error(f"Timeout fetching HTML: {e}")
-            self.current_state = "error"
-            self.error_message = (
-                "Request timed out while fetching the page. "
-                "Please check your connection and try again, or press 'q' to cancel."
+            # On 403, try Playwright and the 403 body itself as fallbacks
+            forbidden = e.response.status_code == 403
+            if not (forbidden and self._recover_from_forbidden(url, e.response.text)):
+                self._report_fetch_error(e)
+            return
+        except Exception as e:
+            self._report_fetch_error(e)
+            return
+
+        if not candidates:
+            # No streams found
+            self.app.call_from_thread(
+                self._show_error,
+                "No playable streams found on this page. "
+                "Please try a different URL or provide a direct stream URL, "
+                "or press 'q' to cancel.",
             )
-            self._update_display()
-        except httpx.RequestError as e:
-            logger.error(f"Network error fetching HTML: {e}")
-            self.current_state = "error"
-            self.error_message = (
-                f"Network error: {e}. "
-                "Please check your connection and try again, or press 'q' to cancel."
+            return
+        self._use_candidates(candidates)
+
+    def _fetch_streams_with_httpx(self, url: str) -> list[StreamCandidate]:
+        """Download the page and extract streams while the body is still arriving.
+
+        Behavior:
+            - Sends If-None-Match / If-Modified-Since when the page was cached before
+            - On 304 Not Modified, returns the cached candidates without parsing
+            - Updates the status with the running candidate count as chunks arrive
+            - Records the response validators and candidates for the next fetch
+
+        Raises:
+            httpx.HTTPStatusError: If the server answers with an error status; the
+                error body has been read so the 403 fallback can scan it
+            httpx.RequestError: If the request fails
+            HTMLParseError: If HTML parsing fails
+        """
+        # Fetch HTML content with browser-like headers to avoid bot detection
+        headers = get_browser_headers(url)
+        # Revalidate pages scanned before instead of downloading them again
+        cached = get_cached_page(url)
+        if cached is not None:
+            headers.update(cached.conditional_headers())
+
+        client = get_http_client()
+        with client.stream("GET", url, headers=headers, timeout=30.0) as response:
+            if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+                logger.info(f"{url} not modified, reusing {len(cached.candidates)} cached streams")
+                return list(cached.candidates)
+            if response.is_error:
+                response.read()
+                response.raise_for_status()
+
+            # Extract streams while the body downloads, never holding the whole page
+            self.app.call_from_thread(self._set_status, "Extracting streams from page...")
+            extractor = HTMLStreamExtractor(
+                url,
+                encoding=response.charset_encoding or "utf-8",
+                max_candidates=MAX_STREAM_CANDIDATES,
             )
-            self._update_display()
-        except HTMLParseError as e:
-            logger.error(f"HTML parse error: {e}")
-            self.current_state = "error"
-            self.error_message = (
-                f"Failed to parse HTML page: {e.user_message or str(e)}. "
-                "Please try a different URL or provide a direct stream URL, or press 'q' to cancel."
+            found = 0
+            for chunk in response.iter_bytes(65536):
+                extractor.feed(chunk)
+                if extractor.candidate_count != found:
+                    # Report progress before the rest of the body has arrived
+                    found = extractor.candidate_count
+                    self.app.call_from_thread(
+                        self._set_status,
+                        f"Extracting streams from page... {found} found",
+                    )
+                if extractor.is_full:
+                    # Enough candidates: stop downloading the rest of the page
+                    break
+            candidates = extractor.close()
+
+        logger.info(f"Fetched HTML content from {url} ({response.num_bytes_downloaded} bytes)")
+        store_cached_page(
+            url,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            candidates=candidates,
+        )
+        return candidates
+
+    def _use_candidates(self, candidates: list[StreamCandidate], source: str | None = None) -> None:
+        """Auto-save a single candidate or show the selection list for several.
+
+        Runs in the URL validation worker thread.
+
+        Args:
+            candidates: Non-empty list of extracted streams
+            source: Strategy that found them, for logging
+        """
+        found_via = f" via {source}" if source else ""
+        self.stream_candidates = candidates
+        if len(candidates) == 1:
+            # Single stream - auto-select and save
+            stream_url = candidates[0].url
+            logger.info(f"Single stream found{found_via}, auto-selecting: {stream_url}")
+            self.app.call_from_thread(self._save_direct_stream_feed, stream_url)
+        else:
+            # Multiple streams - show selection list
+            logger.info(f"Found {len(candidates)} streams{found_via}, showing selection list")
+            self.app.call_from_thread(self._show_stream_selection)
+
+    def _report_fetch_error(self, error: Exception) -> None:
+        """Log a failed page fetch and show the matching user message.
+
+        Runs in the URL validation worker thread.
+        """
+        for error_type, log_prefix, describe in _FETCH_ERRORS:
+            if isinstance(error, error_type):
+                logger.error(f"{log_prefix}: {error}")
+                message = describe(error)
+                break
+        else:
+            logger.error(f"Unexpected error handling HTML page: {error}", exc_info=True)
+            message = (
+                f"An unexpected error occurred: {error}. Please try again or press 'q' to cancel."
             )
-            self._update_display()
-        except Exception as e:
-            logger.error(f"Unexpected error handling HTML page: {e}", exc_info=True)
-            self.current_state = "error"
-            self.error_message = (
-                f"An unexpected error occurred: {e}. " "Please try again or press 'q' to cancel."
+        self.app.call_from_thread(self._show_error, message)
+
+    def _recover_from_forbidden(self, url: str, error_body: str) -> bool:
+        """Race the Playwright fallback against a scan of the 403 response body.
+
+        Some sites return usable markup along with the 403. Scanning it takes
+        milliseconds while a headless browser takes seconds, so both run at once on
+        daemon threads and the first strategy that yields candidates wins; a browser
+        still loading at that point finishes in the background and is ignored.
+
+        Runs in the URL validation worker thread.
+
+        Args:
+            url: Page URL that returned 403
+            error_body: Body of the 403 response
+
+        Returns:
+            True if the outcome has been shown to the user, False if the caller
+            should report the 403.
+        """
+        self.app.call_from_thread(
+            self._set_status, "Access denied. Trying with browser automation..."
+        )
+        logger.info("403 error detected, attempting Playwright fallback and 403 body scan")
+
+        results: queue.Queue[tuple[str, list[StreamCandidate] | None]] = queue.Queue()
+
+        def run(strategy: str, fetch: Callable[[], list[StreamCandidate]]) -> None:
+            try:
+                results.put((strategy, fetch()))
+            except Exception as error:
+                logger.warning(f"{strategy} fallback failed: {error}")
+                results.put((strategy, None))
+
+        strategies: dict[str, Callable[[], list[StreamCandidate]]] = {
+            "Playwright": lambda: self._extract_streams_with_playwright(url),
+            "403 response": lambda: self._extract_streams(error_body, url),
+        }
+        for strategy, fetch in strategies.items():
+            threading.Thread(
+                target=run, args=(strategy, fetch), name=f"403-{strategy}", daemon=True
+            ).start()
+
+        playwright_loaded = False
+        for _ in strategies:
+            strategy, candidates = results.get()
+            if candidates is None:
+                continue
+            if strategy == "Playwright":
+                playwright_loaded = True
+            if not candidates:
+                continue
+
+            self._use_candidates(candidates, strategy)
+            return True
+
+        if playwright_loaded:
+            # Playwright worked but no streams found
+            self.app.call_from_thread(
+                self._show_error,
+                "Page loaded successfully but no playable streams were found. "
+                "The page may not contain embedded video streams, "
+                "or they may be loaded dynamically. "
+                "Please try a direct stream URL instead, "
+                "or press 'q' to cancel.",
             )
-            self._update_display()
+            return True
+        return False
+
+    def _extract_streams_with_playwright(self, url: str) -> list[StreamCandidate]:
+        """Render the page with Playwright and extract streams from the result."""
+        from pick_a_zoo.core.feed_discovery import fetch_html_with_playwright
+
+        html_content = fetch_html_with_playwright(url, timeout=30.0)
+        return self._extract_streams(html_content, url)
+
+    def _extract_streams(self, html_content: str, url: str) -> list[StreamCandidate]:
+        """Extract streams from a fetched page, reusing results for identical content.
+
+        The Playwright fallback and the 403 body retry can hand the same markup back
+        for the same URL; the digest lookup skips tokenizing it a second time.
+        """
+        digest = hashlib.blake2b(html_content.encode("utf-8"), digest_size=8).hexdigest()
+        key = (url, digest)
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Reusing extracted streams for {url} ({digest})")
+            return list(cached)
+        streams = extract_streams_from_html(html_content, url)
+        self._parse_cache[key] = streams
+        return list(streams)
+
+    def _set_status(self, message: str) -> None:
+        """Update the status message, skipping the repaint if it is unchanged."""
+        if message == self._status_text:
+            return
+        self._status_text = message
+        self._w_status.update(message)
+
+    def _show_error(self, message: str) -> None:
+        """Switch to the error state and display message."""
+        self.current_state = "error"
+        self.error_message = message
+        self._update_display()
+
+    def _show_stream_selection(self) -> None:
+        """Switch to the stream selection state and focus the stream list."""
+        self.current_state = "stream_selection"
+        self._update_display()
+        # Focus on stream list for keyboard navigation
+        self._w_stream_list.focus()
 
     def _save_direct_stream_feed(self, url: str) -> None:
-        """Save a direct stream feed."""
+        """Save a direct stream feed.
+
+        The feed is added to app.feeds right away, so a save issued before the
+        write finishes resolves duplicate names against it; writing it to disk is
+        handed to the _persist_feeds worker so the UI thread never waits on file I/O.
+        """
         try:
-            # Load existing feeds
-            existing_feeds = load_feeds()
+            # Start from the app's cached feeds rather than re-reading the config file
+            existing_feeds = list(cast("PickAZooApp", self.app).feeds)
 
             # Resolve duplicate name
             resolved_name = resolve_duplicate_name(self.feed_name or "Unnamed Feed", existing_feeds)
@@ -380,22 +545,88 @@ class AddFeedScreen(Screen):
 
             # Add to list and save
             existing_feeds.append(feed)
-            save_feeds(existing_feeds)
+        except Exception as e:
+            logger.error(f"Error saving feed: {e}", exc_info=True)
+            self._show_error(f"Error saving feed: {e}. Please try again or press 'q' to cancel.")
+            return
 
-            logger.info(f"Feed saved: {resolved_name} -> {url}")
+        cast("PickAZooApp", self.app).feeds = existing_feeds
+        with self._pending_lock:
+            self._pending_feeds.append(feed)
+        self._set_status(f"Saving feed '{resolved_name}'...")
+        self._persist_feeds()
+
+    @work(exclusive=True, thread=True, group="persist")
+    def _persist_feeds(self) -> None:
+        """Write the pending feeds to disk off the UI thread, coalescing rapid saves.
+
+        Waits PERSIST_DEBOUNCE_SECONDS before writing; a newer save in that window
+        cancels this one and leaves its feed queued, so back-to-back saves touch the
+        disk once with every pending feed. The feeds are appended to the config file
+        rather than rewriting every saved feed. The success message is only shown
+        after the write has completed.
+        """
+        time.sleep(self.PERSIST_DEBOUNCE_SECONDS)
+        if get_current_worker().is_cancelled:
+            logger.debug("Feed save superseded by a newer one")
+            return
 
-            # Show success message and return to main menu
-            status_widget = self.query_one("#status-message", Static)
-            status_widget.update(f"Feed '{resolved_name}' saved successfully!")
-            self.app.pop_screen()
+        feeds = self._take_pending_feeds()
+        if not feeds:
+            return
 
+        try:
+            append_feeds(feeds)
         except Exception as e:
             logger.error(f"Error saving feed: {e}", exc_info=True)
-            self.current_state = "error"
-            self.error_message = (
-                f"Error saving feed: {e}. " "Please try again or press 'q' to cancel."
-            )
-            self._update_display()
+            self.app.call_from_thread(self._on_feeds_save_failed, feeds, e)
+            return
+
+        for feed in feeds:
+            logger.info(f"Feed saved: {feed.name} -> {feed.url}")
+        self.app.call_from_thread(self._on_feed_saved, [feed.name for feed in feeds])
+
+    def _take_pending_feeds(self) -> list[Feed]:
+        """Remove and return every queued feed, so exactly one writer persists each."""
+        with self._pending_lock:
+            feeds, self._pending_feeds = self._pending_feeds, []
+        return feeds
+
+    def on_unmount(self) -> None:
+        """Write feeds still waiting on the debounce before the screen goes away.
+
+        Popping the screen (or quitting the app) cancels its workers, which would
+        otherwise drop a save made just before leaving.
+        """
+        feeds = self._take_pending_feeds()
+        if not feeds:
+            return
+        try:
+            append_feeds(feeds)
+        except Exception as e:
+            logger.error(f"Error saving feed on exit: {e}", exc_info=True)
+            unsaved = {id(feed) for feed in feeds}
+            app = cast("PickAZooApp", self.app)
+            app.feeds = [feed for feed in app.feeds if id(feed) not in unsaved]
+            return
+        logger.info(f"Saved {len(feeds)} pending feed(s) on exit")
+
+    def _on_feed_saved(self, feed_names: list[str]) -> None:
+        """Show success and return to main menu."""
+        if self.app.screen is not self:
+            # The user already left this screen; popping now would close another one
+            return
+        label = "Feed" if len(feed_names) == 1 else "Feeds"
+        names = ", ".join(f"'{name}'" for name in feed_names)
+        self._set_status(f"{label} {names} saved successfully!")
+        self.app.pop_screen()
+
+    def _on_feeds_save_failed(self, feeds: list[Feed], error: Exception) -> None:
+        """Drop feeds that could not be written from app.feeds and show the error."""
+        app = cast("PickAZooApp", self.app)
+        unsaved = {id(feed) for feed in feeds}
+        app.feeds = [feed for feed in app.feeds if id(feed) not in unsaved]
+        self._show_error(f"Error saving feed: {error}. Please try again or press 'q' to cancel.")
 
     @on(ListView.Selected, "#stream-list")
     def on_stream_selected(self, event: ListView.Selected) -> None:
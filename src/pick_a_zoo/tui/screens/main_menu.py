@@ -1,5 +1,7 @@
 """Main menu screen for Pick-a-Zoo TUI."""
 
+from typing import TYPE_CHECKING, ClassVar, cast
+
 from loguru import logger
 from textual import on
 from textual.app import ComposeResult
@@ -7,9 +9,8 @@ from textual.containers import Container, Vertical
 from textual.screen import Screen
 from textual.widgets import Label, ListItem, ListView, Static
 
-from pick_a_zoo.core.feed_manager import load_feeds
-from pick_a_zoo.tui.screens.add_feed import AddFeedScreen
-from pick_a_zoo.tui.screens.view_saved_cams import ViewSavedCamsScreen
+if TYPE_CHECKING:
+    from pick_a_zoo.tui.app import PickAZooApp
 
 
 class MainMenuScreen(Screen):
@@ -36,6 +37,9 @@ class MainMenuScreen(Screen):
         ("Quit", "quit", "q"),
     ]
 
+    # (label text, item id) pairs derived once from MENU_OPTIONS
+    _MENU_LABEL_CACHE = tuple((text, option_id) for text, option_id, _ in MENU_OPTIONS)
+
     MIN_TERMINAL_WIDTH = 80
     MIN_TERMINAL_HEIGHT = 24
 
@@ -55,10 +59,14 @@ class MainMenuScreen(Screen):
         self._setup_menu()
         self._check_terminal_size()
 
+    def on_screen_resume(self) -> None:
+        """Called when the menu is shown again (e.g. after adding a feed)."""
+        self._load_feeds_and_update_display()
+
     def _load_feeds_and_update_display(self) -> None:
-        """Load feeds and update status message."""
+        """Read the app's cached feeds and update status message."""
         try:
-            feeds = load_feeds()
+            feeds = cast("PickAZooApp", self.app).feeds
             status_widget = self.query_one("#status-message", Static)
 
             if not feeds:
@@ -77,8 +85,11 @@ class MainMenuScreen(Screen):
     def _setup_menu(self) -> None:
         """Set up the menu list with options."""
         menu_list = self.query_one("#menu-list", ListView)
-        for option_text, option_id, _ in self.MENU_OPTIONS:
-            menu_list.append(ListItem(Label(option_text), id=option_id))
+        # One batched mount instead of an append (and refresh) per option
+        menu_list.extend(
+            ListItem(Label(option_text), id=option_id)
+            for option_text, option_id in self._MENU_LABEL_CACHE
+        )
 
     def _check_terminal_size(self) -> None:
         """Check terminal size and display warning if too small."""
@@ -111,19 +122,33 @@ class MainMenuScreen(Screen):
         Args:
             option: Selected option identifier ("view", "add", "watch", "quit")
         """
-        if option == "quit":
-            self.action_quit()
-        elif option == "view":
-            logger.info("View Saved Cams selected")
-            self.app.push_screen(ViewSavedCamsScreen())
-        elif option == "add":
-            logger.info("Add a New Cam selected")
-            self.app.push_screen(AddFeedScreen())
-        elif option == "watch":
-            logger.info("Watch a Cam selected (not yet implemented)")
-            # Future: push WatchCamScreen()
-        else:
+        handler_name = self._OPTION_HANDLERS.get(option)
+        if handler_name is None:
             logger.warning(f"Unknown option selected: {option}")
+            return
+        # Looked up on the instance so subclass overrides and patched methods apply
+        getattr(self, handler_name)()
+
+    def _open_view_saved_cams(self) -> None:
+        """Open the View Saved Cams screen."""
+        logger.info("View Saved Cams selected")
+        # Deferred like AddFeedScreen: only loaded if the user opens the list
+        from pick_a_zoo.tui.screens.view_saved_cams import ViewSavedCamsScreen
+
+        self.app.push_screen(ViewSavedCamsScreen())
+
+    def _open_add_feed(self) -> None:
+        """Open the Add a New Cam screen."""
+        logger.info("Add a New Cam selected")
+        # Deferred: pulls in httpx, lxml and Playwright only when needed
+        from pick_a_zoo.tui.screens.add_feed import AddFeedScreen
+
+        self.app.push_screen(AddFeedScreen())
+
+    def _open_watch_cam(self) -> None:
+        """Open the Watch a Cam screen."""
+        logger.info("Watch a Cam selected (not yet implemented)")
+        # Future: push WatchCamScreen()
 
     def action_quit(self) -> None:
         """Quit the application."""
@@ -167,3 +192,12 @@ class MainMenuScreen(Screen):
         current_index = menu_list.index
         if current_index is not None and current_index < len(self.MENU_OPTIONS) - 1:
             menu_list.index = current_index + 1
+
+    # Option id -> handler method name, one dict lookup per selection instead of an
+    # if/elif chain
+    _OPTION_HANDLERS: ClassVar[dict[str, str]] = {
+        "view": "_open_view_saved_cams",
+        "add": "_open_add_feed",
+        "watch": "_open_watch_cam",
+        "quit": "action_quit",
+    }
@@ -1,40 +1,53 @@
 """View Saved Cams screen for displaying and navigating saved camera feeds."""
 
+import re
 import subprocess
 import sys
-from urllib.parse import urlparse
+import time
+from collections import Counter
+from operator import itemgetter
+from typing import TYPE_CHECKING, Literal, cast
 
 from loguru import logger
-from textual import on
+from textual import events, on, work
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import ListItem, ListView, Static
+from textual.worker import get_current_worker
 
-from pick_a_zoo.core.feed_manager import load_feeds
+from pick_a_zoo.core.feed_manager import get_config_mtime_ns, load_feeds
 from pick_a_zoo.core.models import Feed
 from pick_a_zoo.core.video_player import DEFAULT_WINDOW_HEIGHT, DEFAULT_WINDOW_WIDTH
 
+if TYPE_CHECKING:
+    from pick_a_zoo.tui.app import PickAZooApp
+
+# Icon shown before each feed name in the list
+_ITEM_PREFIX = "📹 "
+
+# Longest URL accepted from the feeds config (practical browser/server limit)
+MAX_URL_LENGTH = 2048
+
+# Optional scheme followed by a non-empty network location ("scheme://host" or "//host").
+# Single character classes only, no nested quantifiers, so matching stays linear.
+_URL_RE = re.compile(r"(?:[a-zA-Z][a-zA-Z0-9+.\-]*:)?//[^\s/?#]")
+
 
 def _is_valid_url(url: str) -> bool:
     """Check if a URL string is valid.
 
     Args:
-        url: URL string to validate
+        url: URL string to validate; callers convert Feed.url with str() first
 
     Returns:
-        True if URL is non-empty and has valid format, False otherwise
+        True if URL is non-empty, at most MAX_URL_LENGTH characters and has a
+        network location (with or without a scheme), False otherwise
     """
-    if not url or not isinstance(url, str):
-        return False
+    assert isinstance(url, str), f"expected a URL string, got {type(url).__name__}"
     url = url.strip()
-    if not url:
-        return False
-    try:
-        result = urlparse(url)
-        # Check that URL has at least a scheme or netloc
-        return bool(result.scheme and result.netloc) or bool(result.netloc)
-    except Exception:
+    if len(url) > MAX_URL_LENGTH:
         return False
+    return _URL_RE.match(url) is not None
 
 
 class ViewSavedCamsScreen(Screen):
@@ -49,10 +62,21 @@ class ViewSavedCamsScreen(Screen):
         ("d", "navigate_right", "Right"),
     ]
 
+    # Feed items are mounted lazily, this many at a time
+    LIST_CHUNK_SIZE = 50
+    # Mount the next chunk when the highlight is this close to the last mounted item
+    LOAD_MORE_THRESHOLD = 10
+
     def __init__(self, *args, **kwargs):
         """Initialize the screen."""
         super().__init__(*args, **kwargs)
         self._feeds: list[Feed] = []  # Store feeds for selection handling
+        self._names: list[str] = []  # Feed names, parallel to self._feeds
+        self._url_strs: list[str] = []  # Feed URLs as strings, parallel to self._feeds
+        self._feed_labels: list[str] = []  # Display text for every feed, mounted or not
+        self._mounted_count = 0  # Number of feed items mounted in the ListView
+        self._item_index: dict[str, int] = {}  # ListItem id -> index into self._feeds
+        self._terminal_width = 80  # Refreshed on mount and resize, used for truncation
 
     def compose(self) -> ComposeResult:
         """Compose the screen layout."""
@@ -60,169 +84,276 @@ class ViewSavedCamsScreen(Screen):
         yield Static("", id="empty-message")
         yield Static("", id="error-message")
 
-    def on_mount(self) -> None:
-        """Called when screen is mounted. Loads feeds and updates display."""
-        import time
+    async def on_mount(self) -> None:
+        """Called when screen is mounted. Shows cached feeds and revalidates them."""
+        logger.info("ViewSavedCamsScreen mounted, loading feeds")
+        self._terminal_width = self.app.size.width
+        # Cache widget references once; state changes below reuse them
+        self._w_feeds_list = self.query_one("#feeds-list", ListView)
+        self._w_empty = self.query_one("#empty-message", Static)
+        self._w_error = self.query_one("#error-message", Static)
+        self.watch(self._w_feeds_list, "scroll_y", self._on_feeds_scrolled, init=False)
+        app = cast("PickAZooApp", self.app)
+        if app.feeds_mtime_ns is not None:
+            # Stale-while-revalidate: show the app's feeds now, check the file in the worker
+            sorted_feeds, url_strs = self._filter_and_sort_feeds(app.feeds)
+            await self._show_feeds(sorted_feeds, url_strs, time.time())
+        else:
+            # Paint immediately; the worker fills the list once the config is parsed
+            self._w_empty.update("Loading feeds...")
+        self._load_feeds_worker(app.feeds_mtime_ns)
+
+    def on_resize(self, event: events.Resize) -> None:
+        """Remember the terminal width for truncating feed names."""
+        self._terminal_width = event.size.width
+
+    @work(exclusive=True, thread=True)
+    def _load_feeds_worker(self, cached_mtime_ns: int | None) -> None:
+        """Load, filter and sort feeds off the UI thread, then display them.
 
+        Args:
+            cached_mtime_ns: Config mtime of the feeds already displayed, or None.
+                The config is only re-read if its mtime differs.
+        """
         start_time = time.time()
-        logger.info("ViewSavedCamsScreen mounted, loading feeds")
         try:
-            feeds = load_feeds()
-            logger.debug(f"load_feeds() returned {len(feeds)} feeds")
-            valid_feeds = self._filter_valid_feeds(feeds)
-            logger.debug(f"After filtering: {len(valid_feeds)} valid feeds")
-            if not valid_feeds:
-                self._show_empty_state()
-                elapsed = time.time() - start_time
-                logger.info(f"Feed loading completed in {elapsed:.3f}s (empty state)")
+            mtime_ns = get_config_mtime_ns()
+            if cached_mtime_ns is not None and mtime_ns == cached_mtime_ns:
+                logger.debug("Feeds config unchanged, keeping cached feeds")
                 return
+            feeds = load_feeds()
+            logger.opt(lazy=True).debug("load_feeds() returned {} feeds", lambda: len(feeds))
+            sorted_feeds, url_strs = self._filter_and_sort_feeds(feeds)
+            logger.opt(lazy=True).debug(
+                "After filtering: {} valid feeds", lambda: len(sorted_feeds)
+            )
+        except Exception as e:
+            if not get_current_worker().is_cancelled:
+                self.app.call_from_thread(self._show_error, self._load_error_message(e))
+            return
+
+        if get_current_worker().is_cancelled:
+            return
+        self.app.call_from_thread(
+            self._on_feeds_loaded, feeds, mtime_ns, sorted_feeds, url_strs, start_time
+        )
+
+    def _on_feeds_loaded(
+        self,
+        feeds: list[Feed],
+        mtime_ns: int | None,
+        sorted_feeds: list[Feed],
+        url_strs: list[str],
+        start_time: float,
+    ) -> None:
+        """Publish freshly loaded feeds to the app cache and display them.
 
-            sorted_feeds = self._sort_feeds(valid_feeds)
-            self._feeds = sorted_feeds  # Store for selection handling
-            logger.debug(f"About to populate list with {len(sorted_feeds)} feeds")
-            self._populate_list(sorted_feeds)
+        Args:
+            feeds: Feeds as loaded from the config file
+            mtime_ns: Config mtime the feeds were loaded from
+            sorted_feeds: Valid feeds in display order
+            url_strs: URLs of sorted_feeds as strings, in the same order
+            start_time: time.time() when loading started, for logging
+        """
+        app = cast("PickAZooApp", self.app)
+        app.feeds = feeds
+        app.feeds_mtime_ns = mtime_ns
+        # _show_feeds awaits widget removal, so run it as a task on the screen
+        self.call_later(self._show_feeds, sorted_feeds, url_strs, start_time)
+
+    async def _show_feeds(
+        self, sorted_feeds: list[Feed], url_strs: list[str], start_time: float
+    ) -> None:
+        """Display the loaded feeds, or the empty state if there are none.
+
+        Args:
+            sorted_feeds: Valid feeds in display order
+            url_strs: URLs of sorted_feeds as strings, in the same order
+            start_time: time.time() when loading started, for logging
+        """
+        if not sorted_feeds:
+            self._show_empty_state()
             elapsed = time.time() - start_time
-            logger.info(f"Loaded and displayed {len(sorted_feeds)} feeds in {elapsed:.3f}s")
-        except PermissionError as e:
-            logger.error(f"Permission denied loading feeds: {e}", exc_info=True)
-            self._show_error("Cannot read configuration file. Check permissions.")
-        except OSError as e:
-            logger.error(f"OS error loading feeds: {e}", exc_info=True)
-            self._show_error(
-                "Failed to read configuration file. File may be locked or inaccessible."
+            logger.info(f"Feed loading completed in {elapsed:.3f}s (empty state)")
+            return
+
+        try:
+            self._feeds = sorted_feeds  # Store for selection handling
+            self._url_strs = url_strs
+            # Name-only passes below walk this list instead of the Feed objects
+            self._names = [feed.name for feed in sorted_feeds]
+            logger.opt(lazy=True).debug(
+                "About to populate list with {} feeds", lambda: len(sorted_feeds)
             )
+            await self._populate_list(self._names)
         except Exception as e:
-            logger.error(f"Unexpected error loading feeds: {e}", exc_info=True)
-            # Show more detailed error message to help debug
-            error_detail = str(e)
-            if len(error_detail) > 100:
-                error_detail = error_detail[:100] + "..."
-            self._show_error(f"Failed to load feeds: {error_detail}")
+            self._show_error(self._load_error_message(e))
+            return
+        elapsed = time.time() - start_time
+        logger.info(f"Loaded and displayed {len(sorted_feeds)} feeds in {elapsed:.3f}s")
 
-    def _filter_valid_feeds(self, feeds: list[Feed]) -> list[Feed]:
-        """Filter out feeds with invalid or missing URLs.
+    def _load_error_message(self, error: Exception) -> str:
+        """Log a feed loading failure and build the message shown to the user.
 
         Args:
-            feeds: List of Feed objects to filter
+            error: Exception raised while loading or displaying feeds
 
         Returns:
-            List of Feed objects with valid URLs
+            User-facing error message
         """
-        valid_feeds = []
-        for feed in feeds:
-            if feed.url and _is_valid_url(str(feed.url)):
-                valid_feeds.append(feed)
-            else:
-                logger.warning(f"Skipping feed with invalid URL: {feed.name}")
-        return valid_feeds
-
-    def _sort_feeds(self, feeds: list[Feed]) -> list[Feed]:
-        """Sort feeds alphabetically by name (case-insensitive).
+        if isinstance(error, PermissionError):
+            logger.error(f"Permission denied loading feeds: {error}", exc_info=True)
+            return "Cannot read configuration file. Check permissions."
+        if isinstance(error, OSError):
+            logger.error(f"OS error loading feeds: {error}", exc_info=True)
+            return "Failed to read configuration file. File may be locked or inaccessible."
+        logger.error(f"Unexpected error loading feeds: {error}", exc_info=True)
+        # Show more detailed error message to help debug
+        error_detail = str(error)
+        if len(error_detail) > 100:
+            error_detail = error_detail[:100] + "..."
+        return f"Failed to load feeds: {error_detail}"
+
+    def _filter_and_sort_feeds(self, feeds: list[Feed]) -> tuple[list[Feed], list[str]]:
+        """Drop feeds with invalid URLs and sort the rest by name, in one pass.
+
+        Each URL is converted to a string and each name lower-cased once while
+        validating, and the list is sorted once on those keys.
 
         Args:
-            feeds: List of Feed objects to sort
+            feeds: List of Feed objects to filter and sort
 
         Returns:
-            Sorted list of Feed objects
+            Tuple of (feeds, url_strs): feeds with valid URLs sorted alphabetically
+            by name (case-insensitive), and their URLs as strings in the same order
         """
-        return sorted(feeds, key=lambda f: f.name.lower())
+        keyed = []
+        for feed in feeds:
+            url_str = str(feed.url) if feed.url else ""
+            if _is_valid_url(url_str):
+                keyed.append((feed.name.lower(), url_str, feed))
+            else:
+                logger.warning(f"Skipping feed with invalid URL: {feed.name}")
+        keyed.sort(key=itemgetter(0))
+        return [feed for _, _, feed in keyed], [url_str for _, url_str, _ in keyed]
 
-    def _resolve_duplicate_names(self, feeds: list[Feed]) -> list[tuple[Feed, str]]:
+    def _resolve_duplicate_names(self, names: list[str]) -> list[str]:
         """Resolve duplicate feed names by adding number suffixes.
 
         Args:
-            feeds: List of Feed objects
+            names: Feed names in display order
 
         Returns:
-            List of tuples (Feed, display_name) with resolved names
+            Display names, parallel to names, with duplicates numbered
         """
-        name_counts: dict[str, int] = {}
-        result = []
+        if len(set(names)) == len(names):
+            # Fast path: all names unique (the usual case), nothing to number
+            return list(names)
 
-        for feed in feeds:
-            base_name = feed.name
-            if base_name in name_counts:
-                name_counts[base_name] += 1
-                display_name = f"{base_name} ({name_counts[base_name]})"
-            else:
-                name_counts[base_name] = 1
-                display_name = base_name
-            result.append((feed, display_name))
+        # Count first so names that occur once skip the suffix bookkeeping
+        counts = Counter(names)
+        seen: dict[str, int] = {}
+        result = []
+        for base_name in names:
+            if counts[base_name] == 1:
+                result.append(base_name)
+                continue
+            occurrence = seen.get(base_name, 0) + 1
+            seen[base_name] = occurrence
+            result.append(base_name if occurrence == 1 else f"{base_name} ({occurrence})")
 
         return result
 
-    def _truncate_name(self, name: str, max_width: int) -> str:
-        """Truncate long names with ellipsis.
+    async def _populate_list(self, names: list[str]) -> None:
+        """Populate the ListView with feed items.
 
         Args:
-            name: Name to truncate
-            max_width: Maximum width for the name
-
-        Returns:
-            Truncated name with ellipsis if needed
+            names: Feed names to display, parallel to self._feeds
         """
-        if len(name) <= max_width:
-            return name
-        return name[: max_width - 3] + "..."
+        list_view = self._w_feeds_list
 
-    def _populate_list(self, feeds: list[Feed]) -> None:
-        """Populate the ListView with feed items.
+        # Await removal so re-populating can reuse the "feed-N" ids
+        self._mounted_count = 0
+        self._item_index.clear()
+        await list_view.clear()
+
+        # Resolve duplicate names
+        display_names = self._resolve_duplicate_names(names)
+
+        # Account for emoji (2 chars) and padding (2 chars)
+        max_name_width = max(20, self._terminal_width - 4)
+
+        # Labels are cheap strings; widgets are only built for the mounted window.
+        # Names longer than max_name_width are cut and end in an ellipsis.
+        cut = max_name_width - 3
+        self._feed_labels = [
+            _ITEM_PREFIX + name if len(name) <= max_name_width else f"{_ITEM_PREFIX}{name[:cut]}..."
+            for name in display_names
+        ]
+        self._mount_next_chunk()
+
+        self._set_state("list")
+
+    def _mount_next_chunk(self) -> None:
+        """Mount the next LIST_CHUNK_SIZE feed items in one batch."""
+        start = self._mounted_count
+        end = min(start + self.LIST_CHUNK_SIZE, len(self._feed_labels))
+        if start >= end:
+            return
+        # Use "feed-" prefix to ensure valid CSS identifier (can't start with number)
+        item_ids = [f"feed-{idx}" for idx in range(start, end)]
+        self._item_index.update(zip(item_ids, range(start, end), strict=True))
+        self._w_feeds_list.extend(
+            ListItem(Static(self._feed_labels[idx]), id=item_id)
+            for idx, item_id in zip(range(start, end), item_ids, strict=True)
+        )
+        self._mounted_count = end
+        logger.opt(lazy=True).debug(
+            "Mounted feed items {}-{} of {}",
+            lambda: start,
+            lambda: end - 1,
+            lambda: len(self._feed_labels),
+        )
+
+    def _mount_more_if_near_end(self, position: int | None) -> None:
+        """Mount another chunk when position is close to the last mounted item.
 
         Args:
-            feeds: List of Feed objects to display
+            position: Highlighted item index, or None
         """
-        try:
-            list_view = self.query_one("#feeds-list", ListView)
-        except Exception as e:
-            logger.error(f"Failed to query feeds-list: {e}", exc_info=True)
-            raise
+        if position is None or self._mounted_count >= len(self._feed_labels):
+            return
+        if position >= self._mounted_count - self.LOAD_MORE_THRESHOLD:
+            self._mount_next_chunk()
 
-        list_view.clear()
+    @on(ListView.Highlighted, "#feeds-list")
+    def on_feed_highlighted(self, event: ListView.Highlighted) -> None:
+        """Mount more feed items as the highlight approaches the end of the list."""
+        self._mount_more_if_near_end(event.list_view.index)
 
-        # Resolve duplicate names
-        feeds_with_names = self._resolve_duplicate_names(feeds)
+    def _on_feeds_scrolled(self, scroll_y: float) -> None:
+        """Mount more feed items when the list is scrolled to the bottom."""
+        if scroll_y >= self._w_feeds_list.max_scroll_y:
+            self._mount_more_if_near_end(self._mounted_count - 1)
 
-        # Get terminal width for truncation
-        # Use app.size as screen size might not be available yet
-        try:
-            if hasattr(self, "app") and self.app and hasattr(self.app, "size") and self.app.size:
-                terminal_width = self.app.size.width
-            else:
-                terminal_width = 80
-        except (AttributeError, TypeError) as e:
-            logger.debug(f"Could not get terminal width: {e}, using default 80")
-            terminal_width = 80
-        # Account for emoji (2 chars) and padding (2 chars)
-        max_name_width = max(20, terminal_width - 4)
-
-        for idx, (feed, display_name) in enumerate(feeds_with_names):
-            # Truncate name if needed
-            truncated_name = self._truncate_name(display_name, max_name_width)
-            # Add emoji icon
-            display_text = f"📹 {truncated_name}"
-
-            # Create ListItem with index as id for selection handling
-            # Use "feed-" prefix to ensure valid CSS identifier (can't start with number)
-            list_item = ListItem(Static(display_text), id=f"feed-{idx}")
-            list_view.append(list_item)
-
-        # Show list, hide empty/error messages
-        list_view.visible = True
-        empty_msg = self.query_one("#empty-message", Static)
-        empty_msg.visible = False
-        error_msg = self.query_one("#error-message", Static)
-        error_msg.visible = False
+    def _set_state(self, state: Literal["list", "empty", "error"]) -> None:
+        """Show exactly one of the feed list, empty message or error message.
+
+        All three visibility flags are set inside one batch update, so a state
+        change costs a single refresh.
+
+        Args:
+            state: Which widget to show
+        """
+        with self.app.batch_update():
+            self._w_feeds_list.visible = state == "list"
+            self._w_empty.visible = state == "empty"
+            self._w_error.visible = state == "error"
 
     def _show_empty_state(self) -> None:
         """Display empty state message when no feeds exist."""
-        empty_msg = self.query_one("#empty-message", Static)
-        empty_msg.update("No feeds saved.\n\nUse 'Add a New Cam' to add feeds.")
-        empty_msg.visible = True
-
-        list_view = self.query_one("#feeds-list", ListView)
-        list_view.visible = False
-        error_msg = self.query_one("#error-message", Static)
-        error_msg.visible = False
+        self._w_empty.update("No feeds saved.\n\nUse 'Add a New Cam' to add feeds.")
+        self._set_state("empty")
 
         logger.info("Displaying empty state")
 
@@ -233,21 +364,8 @@ class ViewSavedCamsScreen(Screen):
             error_text: Error message to display
         """
         try:
-            error_msg = self.query_one("#error-message", Static)
-            error_msg.update(f"Error: {error_text}\n\nPress Escape or Q to return to menu.")
-            error_msg.visible = True
-
-            try:
-                list_view = self.query_one("#feeds-list", ListView)
-                list_view.visible = False
-            except Exception:
-                pass  # ListView might not exist
-
-            try:
-                empty_msg = self.query_one("#empty-message", Static)
-                empty_msg.visible = False
-            except Exception:
-                pass  # Empty message might not exist
+            self._w_error.update(f"Error: {error_text}\n\nPress Escape or Q to return to menu.")
+            self._set_state("error")
 
             logger.error(f"Displaying error: {error_text}")
         except Exception as e:
@@ -264,14 +382,14 @@ class ViewSavedCamsScreen(Screen):
 
     def action_navigate_up(self) -> None:
         """Navigate list up (WASD: W key)."""
-        list_view = self.query_one("#feeds-list", ListView)
+        list_view = self._w_feeds_list
         current_index = list_view.index
         if current_index is not None and current_index > 0:
             list_view.index = current_index - 1
 
     def action_navigate_down(self) -> None:
         """Navigate list down (WASD: S key)."""
-        list_view = self.query_one("#feeds-list", ListView)
+        list_view = self._w_feeds_list
         current_index = list_view.index
         if current_index is not None:
             max_index = len(list_view.children) - 1
@@ -296,49 +414,42 @@ class ViewSavedCamsScreen(Screen):
             event: ListView selection event
         """
         selected_item = event.item
-        if selected_item and selected_item.id:
-            try:
-                # Extract index from "feed-{idx}" format
-                if selected_item.id.startswith("feed-"):
-                    feed_index = int(selected_item.id[5:])  # Remove "feed-" prefix
-                else:
-                    # Fallback for old format (shouldn't happen, but be safe)
-                    feed_index = int(selected_item.id)
-
-                if 0 <= feed_index < len(self._feeds):
-                    feed = self._feeds[feed_index]
-                    logger.info(f"Feed selected: {feed.name} ({feed.url})")
-                    # Launch video window for selected feed as separate process
-                    try:
-                        # Get window dimensions from feed or use defaults
-                        width = DEFAULT_WINDOW_WIDTH
-                        height = DEFAULT_WINDOW_HEIGHT
-                        if feed.window_size:
-                            width = feed.window_size.width
-                            height = feed.window_size.height
-
-                        # Launch video window in separate process to avoid TUI conflicts
-                        # This prevents Qt warnings and ANSI escape codes from corrupting the TUI
-                        subprocess.Popen(
-                            [
-                                sys.executable,
-                                "-m",
-                                "pick_a_zoo.gui.player_launcher",
-                                feed.name,
-                                str(feed.url),
-                                str(width),
-                                str(height),
-                            ],
-                            # Redirect stdout/stderr to prevent Qt output from corrupting TUI
-                            stdout=subprocess.DEVNULL,
-                            stderr=subprocess.DEVNULL,
-                        )
-
-                        logger.info(
-                            f"Video window launched for feed: {feed.name} (separate process)"
-                        )
-                    except Exception as e:
-                        logger.error(f"Failed to launch video window: {e}", exc_info=True)
-                        self._show_error(f"Failed to launch video window: {str(e)}")
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Invalid feed index: {selected_item.id}: {e}")
+        item_id = selected_item.id if selected_item else None
+        feed_index = self._item_index.get(item_id) if item_id else None
+        if feed_index is None:
+            logger.warning(f"Selected item is not a feed: {item_id}")
+            return
+
+        feed = self._feeds[feed_index]
+        url_str = self._url_strs[feed_index]
+        logger.info(f"Feed selected: {feed.name} ({url_str})")
+        # Launch video window for selected feed as separate process
+        try:
+            # Get window dimensions from feed or use defaults
+            width = DEFAULT_WINDOW_WIDTH
+            height = DEFAULT_WINDOW_HEIGHT
+            if feed.window_size:
+                width = feed.window_size.width
+                height = feed.window_size.height
+
+            # Launch video window in separate process to avoid TUI conflicts
+            # This prevents Qt warnings and ANSI escape codes from corrupting the TUI
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "pick_a_zoo.gui.player_launcher",
+                    feed.name,
+                    url_str,
+                    str(width),
+                    str(height),
+                ],
+                # Redirect stdout/stderr to prevent Qt output from corrupting TUI
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+
+            logger.info(f"Video window launched for feed: {feed.name} (separate process)")
+        except Exception as e:
+            logger.error(f"Failed to launch video window: {e}", exc_info=True)
+            self._show_error(f"Failed to launch video window: {str(e)}")
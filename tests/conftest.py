@@ -0,0 +1,57 @@
+"""Shared pytest fixtures for Pick-a-Zoo tests."""
+
+import sys
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _clear_url_caches() -> None:
+    """Start every test without feed_discovery's cached detection/validation results."""
+    # Only if already imported, so tests that never touch discovery don't pay for httpx/lxml
+    feed_discovery = sys.modules.get("pick_a_zoo.core.feed_discovery")
+    if feed_discovery is not None:
+        feed_discovery.clear_url_caches()
+
+
+@pytest.fixture
+def mock_httpx_client(monkeypatch: pytest.MonkeyPatch) -> Callable[..., Mock]:
+    """Factory that replaces feed_discovery's shared HTTP client with a mock.
+
+    Call it with head_return (response returned by head()) and/or head_side_effect
+    (exception, or list of responses, raised/returned by head()), and optionally
+    get_return (response yielded by the ranged GET retry via stream()). Returns the
+    mock client.
+    """
+
+    def _make(**kwargs: Any) -> Mock:
+        client = Mock()
+        if "head_return" in kwargs:
+            client.head.return_value = kwargs["head_return"]
+        if "head_side_effect" in kwargs:
+            client.head.side_effect = kwargs["head_side_effect"]
+        if "get_return" in kwargs:
+            stream = client.stream.return_value
+            stream.__enter__ = Mock(return_value=kwargs["get_return"])
+            stream.__exit__ = Mock(return_value=False)
+        monkeypatch.setattr("pick_a_zoo.core.feed_discovery.get_http_client", lambda: client)
+        return client
+
+    return _make
+
+
+@pytest.fixture
+def mock_head_response() -> Callable[..., Mock]:
+    """Factory for mock HEAD responses: (status_code, content_type, redirects=0)."""
+
+    def _make(status_code: int, content_type: str, redirects: int = 0) -> Mock:
+        response = Mock()
+        response.status_code = status_code
+        response.headers = {"Content-Type": content_type}
+        response.history = [Mock() for _ in range(redirects)]
+        return response
+
+    return _make
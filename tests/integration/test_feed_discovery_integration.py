@@ -1,7 +1,7 @@
 """Integration tests for feed discovery functionality."""
 
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -11,22 +11,14 @@ from pick_a_zoo.core.models import Feed
 
 
 @pytest.mark.integration
-@patch("pick_a_zoo.core.feed_discovery.httpx.Client")
-def test_end_to_end_direct_stream_feed_addition(mock_client_class, tmp_path: Path):
+def test_end_to_end_direct_stream_feed_addition(
+    mock_httpx_client, mock_head_response, tmp_path: Path
+):
     """Test end-to-end direct stream feed addition."""
     from pick_a_zoo.core.feed_discovery import validate_url_accessibility
 
     # Mock URL detection and validation
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.headers = {"Content-Type": "video/mp4"}
-    mock_response.history = []
-
-    mock_client = Mock()
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client.head.return_value = mock_response
-    mock_client_class.return_value = mock_client
+    mock_httpx_client(head_return=mock_head_response(200, "video/mp4"))
 
     # Test URL detection
     url = "https://example.com/stream.mp4"
@@ -83,28 +75,17 @@ def test_duplicate_name_resolution_integration(tmp_path: Path):
 
 
 @pytest.mark.integration
-@patch("pick_a_zoo.core.feed_discovery.httpx.Client")
-def test_url_validation_integration(mock_client_class):
+def test_url_validation_integration(mock_httpx_client, mock_head_response):
     """Test URL validation integration."""
     from pick_a_zoo.core.feed_discovery import validate_url_accessibility
 
-    # Test accessible URL
-    mock_response_ok = Mock()
-    mock_response_ok.status_code = 200
-    mock_response_ok.headers = {"Content-Type": "video/mp4"}
-    mock_response_ok.history = []
-
-    # Test inaccessible URL
-    mock_response_404 = Mock()
-    mock_response_404.status_code = 404
-    mock_response_404.headers = {"Content-Type": "text/html"}
-    mock_response_404.history = []
-
-    mock_client = Mock()
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client.head.side_effect = [mock_response_ok, mock_response_404]
-    mock_client_class.return_value = mock_client
+    # First call answers 200, second 404
+    mock_httpx_client(
+        head_side_effect=[
+            mock_head_response(200, "video/mp4"),
+            mock_head_response(404, "text/html"),
+        ]
+    )
 
     # Test accessible URL
     result1 = validate_url_accessibility("https://example.com/stream.mp4")
@@ -27,6 +27,32 @@ def test_feed_loading_integration_on_app_startup(mock_load_feeds):
     PickAZooApp()
 
 
+@pytest.mark.integration
+@patch("pick_a_zoo.tui.app.load_feeds")
+def test_app_caches_feeds_loaded_at_startup(mock_load_feeds):
+    """Test the app loads feeds once on mount and the main menu reads the cached list."""
+    import asyncio
+
+    from textual.widgets import Static
+
+    from pick_a_zoo.core.models import Feed
+
+    mock_load_feeds.return_value = [
+        Feed(name="Panda Cam", url="https://example.com/panda.m3u8"),
+        Feed(name="Otter Cam", url="https://example.com/otter.m3u8"),
+    ]
+
+    async def run_app() -> str:
+        app = PickAZooApp()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert [feed.name for feed in app.feeds] == ["Panda Cam", "Otter Cam"]
+            return str(app.screen.query_one("#status-message", Static).render())
+
+    assert asyncio.run(run_app()) == "2 cams saved"
+    mock_load_feeds.assert_called_once()
+
+
 @pytest.mark.integration
 @patch("pick_a_zoo.core.feed_manager.load_feeds")
 def test_missing_config_file_recovery(mock_load_feeds):
@@ -146,3 +172,159 @@ def test_view_saved_cams_screen_handling_file_permission_errors(mock_load_feeds)
     screen = ViewSavedCamsScreen()
     # Verify permission error handling exists
     assert hasattr(screen, "_show_error") or hasattr(screen, "on_mount")
+
+
+@pytest.mark.integration
+@patch("pick_a_zoo.tui.app.get_config_mtime_ns", return_value=None)
+@patch("pick_a_zoo.tui.app.load_feeds", return_value=[])
+@patch("pick_a_zoo.tui.screens.view_saved_cams.load_feeds")
+def test_view_saved_cams_screen_mounts_feed_items_lazily(
+    mock_load_feeds, mock_app_load_feeds, mock_app_mtime
+):
+    """Test ViewSavedCamsScreen mounts feed items in chunks as the highlight moves down."""
+    import asyncio
+
+    from textual.widgets import ListView
+
+    from pick_a_zoo.core.models import Feed
+    from pick_a_zoo.tui.screens.view_saved_cams import ViewSavedCamsScreen
+
+    mock_load_feeds.return_value = [
+        Feed(name=f"Cam {i:03d}", url=f"https://example.com/{i}.m3u8") for i in range(120)
+    ]
+
+    async def run_app() -> list[int]:
+        app = PickAZooApp()
+        counts = []
+        async with app.run_test() as pilot:
+            await app.push_screen(ViewSavedCamsScreen())
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            list_view = app.screen.query_one("#feeds-list", ListView)
+            counts.append(len(list_view.children))
+
+            list_view.index = 45
+            await pilot.pause()
+            counts.append(len(list_view.children))
+        return counts
+
+    chunk = ViewSavedCamsScreen.LIST_CHUNK_SIZE
+    assert asyncio.run(run_app()) == [chunk, 2 * chunk]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ("file_mtime_ns", "expected_names"),
+    [
+        (100, ["Otter Cam", "Panda Cam"]),  # Unchanged: served from the app cache
+        (200, ["Lemur Cam"]),  # Changed on disk: reloaded in the background
+    ],
+)
+def test_view_saved_cams_screen_revalidates_app_feed_cache(file_mtime_ns, expected_names):
+    """Test ViewSavedCamsScreen shows cached feeds and reloads only if the config changed."""
+    import asyncio
+
+    from textual.widgets import ListView
+
+    from pick_a_zoo.core.models import Feed
+    from pick_a_zoo.tui.screens.view_saved_cams import ViewSavedCamsScreen
+
+    cached_feeds = [
+        Feed(name="Panda Cam", url="https://example.com/panda.m3u8"),
+        Feed(name="Otter Cam", url="https://example.com/otter.m3u8"),
+    ]
+    disk_feeds = [Feed(name="Lemur Cam", url="https://example.com/lemur.m3u8")]
+
+    async def run_app() -> tuple[list[str], list[str], int | None]:
+        app = PickAZooApp()
+        async with app.run_test() as pilot:
+            await app.push_screen(ViewSavedCamsScreen())
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            screen = app.screen
+            assert isinstance(screen, ViewSavedCamsScreen)
+            assert len(app.screen.query_one("#feeds-list", ListView).children) == len(
+                expected_names
+            )
+            return screen._names, [feed.name for feed in app.feeds], app.feeds_mtime_ns
+
+    with (
+        patch("pick_a_zoo.tui.app.load_feeds", return_value=cached_feeds),
+        patch("pick_a_zoo.tui.app.get_config_mtime_ns", return_value=100),
+        patch(
+            "pick_a_zoo.tui.screens.view_saved_cams.get_config_mtime_ns",
+            return_value=file_mtime_ns,
+        ),
+        patch(
+            "pick_a_zoo.tui.screens.view_saved_cams.load_feeds", return_value=disk_feeds
+        ) as mock_load_feeds,
+    ):
+        names, app_feed_names, app_mtime_ns = asyncio.run(run_app())
+
+    assert names == expected_names
+    assert mock_load_feeds.called is (file_mtime_ns != 100)
+    assert app_mtime_ns == file_mtime_ns
+    assert sorted(app_feed_names) == sorted(expected_names)
+
+
+@pytest.mark.integration
+def test_add_feed_screen_coalesced_saves_keep_every_feed():
+    """Test saves inside the persist debounce window are written together, none dropped."""
+    import asyncio
+
+    from pick_a_zoo.tui.screens.add_feed import AddFeedScreen
+
+    async def run_app() -> list[str]:
+        app = PickAZooApp()
+        async with app.run_test() as pilot:
+            screen = AddFeedScreen()
+            await app.push_screen(screen)
+            screen.feed_name = "Panda Cam"
+            screen._save_direct_stream_feed("https://example.com/panda1.m3u8")
+            screen._save_direct_stream_feed("https://example.com/panda2.m3u8")
+            # The superseded worker ends cancelled, so wait on the screen, not the workers
+            for _ in range(40):
+                if app.screen is not screen:
+                    break
+                await pilot.pause(0.05)
+            return [feed.name for feed in app.feeds]
+
+    with (
+        patch("pick_a_zoo.tui.app.load_feeds", return_value=[]),
+        patch("pick_a_zoo.tui.screens.add_feed.append_feeds") as mock_append_feeds,
+    ):
+        app_feed_names = asyncio.run(run_app())
+
+    assert app_feed_names == ["Panda Cam", "Panda Cam (2)"]
+    mock_append_feeds.assert_called_once()
+    assert [feed.name for feed in mock_append_feeds.call_args.args[0]] == [
+        "Panda Cam",
+        "Panda Cam (2)",
+    ]
+
+
+@pytest.mark.integration
+def test_add_feed_screen_save_then_leave_keeps_feed_on_disk(tmp_path, monkeypatch):
+    """Test a feed saved right before leaving the screen is still written to the config."""
+    import asyncio
+
+    from pick_a_zoo.core.feed_manager import load_feeds
+    from pick_a_zoo.tui.screens.add_feed import AddFeedScreen
+
+    config_file = tmp_path / "feeds.yaml"
+    monkeypatch.setattr("pick_a_zoo.core.feed_manager.get_config_path", lambda: config_file)
+
+    async def run_app() -> None:
+        app = PickAZooApp()
+        async with app.run_test() as pilot:
+            screen = AddFeedScreen()
+            await app.push_screen(screen)
+            screen.feed_name = "Panda Cam"
+            screen._save_direct_stream_feed("https://example.com/panda.m3u8")
+            # Leave inside the debounce window, before the worker writes
+            screen.action_cancel()
+            await pilot.pause()
+
+    asyncio.run(run_app())
+
+    assert [feed.name for feed in load_feeds()] == ["Panda Cam"]
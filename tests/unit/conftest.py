@@ -0,0 +1,113 @@
+"""Shared fixtures for Pick-a-Zoo unit tests."""
+
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from pick_a_zoo.core.models import WindowSize
+
+
+class _NoOp:
+    """Chainable no-op: calling it returns None and every attribute is itself."""
+
+    def __call__(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> "_NoOp":
+        return self
+
+
+_NOOP = _NoOp()
+
+
+class _QtStub:
+    """Base for stand-in Qt classes: any constructor args, every missing attribute a no-op.
+
+    Stubs keep no per-test state, so tests check the widgets they end up holding
+    rather than how often a Qt class was instantiated.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> _NoOp:
+        return _NOOP
+
+
+def _make_mock_class(name: str) -> type[_QtStub]:
+    """Create a lightweight stand-in for the Qt class called name."""
+    return type(name, (_QtStub,), {})
+
+
+# Mock PyQt6 tree, built once at import and shared by every test that needs it
+_MOCK_QT_WIDGETS = Mock()
+_MOCK_QT_WIDGETS.QMainWindow = _make_mock_class("QMainWindow")
+_MOCK_QT_WIDGETS.QWidget = _make_mock_class("QWidget")
+_MOCK_QT_WIDGETS.QLabel = _make_mock_class("QLabel")
+_MOCK_QT_WIDGETS.QVBoxLayout = _make_mock_class("QVBoxLayout")
+_MOCK_QT_WIDGETS.QPushButton = _make_mock_class("QPushButton")
+
+_MOCK_QT_CORE = Mock()
+_MOCK_QT_CORE.Qt = Mock()
+_MOCK_QT_CORE.Qt.AlignmentFlag = Mock(AlignCenter=Mock())
+_MOCK_QT_CORE.QTimer = _make_mock_class("QTimer")
+
+_MOCK_QT_GUI = Mock()
+
+_MOCK_PYQT6 = Mock()
+_MOCK_PYQT6.QtWidgets = _MOCK_QT_WIDGETS
+_MOCK_PYQT6.QtCore = _MOCK_QT_CORE
+_MOCK_PYQT6.QtGui = _MOCK_QT_GUI
+
+_MOCK_PYQT6_MODULES = {
+    "PyQt6": _MOCK_PYQT6,
+    "PyQt6.QtWidgets": _MOCK_QT_WIDGETS,
+    "PyQt6.QtCore": _MOCK_QT_CORE,
+    "PyQt6.QtGui": _MOCK_QT_GUI,
+}
+
+# Installed once at conftest import, before any test module is collected; only our
+# keys are saved and restored, instead of snapshotting all of sys.modules per test
+_SAVED_PYQT6_MODULES: dict[str, ModuleType | None] = {
+    name: sys.modules.get(name) for name in _MOCK_PYQT6_MODULES
+}
+sys.modules.update(_MOCK_PYQT6_MODULES)
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """Put back whatever PyQt6 modules were there before the mock tree was installed."""
+    for name, module in _SAVED_PYQT6_MODULES.items():
+        if module is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = module
+
+
+@pytest.fixture(scope="session")
+def mock_pyqt6() -> Mock:
+    """Mock PyQt6 module tree installed for the session.
+
+    To control what a Qt class returns, monkeypatch it on the module mock, e.g.
+    monkeypatch.setattr(mock_pyqt6.QtWidgets, "QMainWindow", lambda: window).
+    """
+    return _MOCK_PYQT6
+
+
+@dataclass(frozen=True, slots=True)
+class FeedStub:
+    """Duck-typed stand-in for Feed where model validation is not under test."""
+
+    name: str
+    url: str
+    window_size: WindowSize | None = None
+
+
+@pytest.fixture(scope="session")
+def make_feed() -> Callable[..., FeedStub]:
+    """Factory for FeedStub instances, e.g. make_feed("Panda Cam", "https://...")."""
+    return FeedStub
@@ -2,6 +2,7 @@
 
 from unittest.mock import patch
 
+import httpx
 import pytest
 
 from pick_a_zoo.tui.screens.add_feed import AddFeedScreen
@@ -28,11 +29,11 @@ def test_add_feed_screen_url_input_validation():
 @pytest.mark.unit
 @patch("pick_a_zoo.tui.screens.add_feed.detect_url_type")
 @patch("pick_a_zoo.tui.screens.add_feed.validate_url_accessibility")
-@patch("pick_a_zoo.tui.screens.add_feed.load_feeds")
+@patch("pick_a_zoo.tui.app.load_feeds")
 @patch("pick_a_zoo.tui.screens.add_feed.resolve_duplicate_name")
-@patch("pick_a_zoo.tui.screens.add_feed.save_feeds")
+@patch("pick_a_zoo.tui.screens.add_feed.append_feeds")
 def test_add_feed_screen_direct_stream_workflow_success_case(
-    mock_save_feeds,
+    mock_append_feeds,
     mock_resolve_duplicate_name,
     mock_load_feeds,
     mock_validate_url,
@@ -91,3 +92,138 @@ def test_add_feed_screen_cancellation_at_url_entry():
     screen = AddFeedScreen()
     # Test that cancellation returns to main menu
     assert hasattr(screen, "on_cancel") or hasattr(screen, "action_cancel")
+
+
+@pytest.mark.unit
+@patch("pick_a_zoo.tui.screens.add_feed.extract_streams_from_html")
+def test_add_feed_screen_extract_streams_reuses_identical_content(mock_extract):
+    """Test AddFeedScreen parses identical page content for a URL only once."""
+    from pick_a_zoo.core.feed_discovery import StreamCandidate
+
+    candidate = StreamCandidate(url="https://example.com/cam.m3u8", source_type="video_tag")
+    mock_extract.return_value = [candidate]
+
+    screen = AddFeedScreen()
+    first = screen._extract_streams("<video></video>", "https://example.com/")
+    second = screen._extract_streams("<video></video>", "https://example.com/")
+    screen._extract_streams("<p>changed</p>", "https://example.com/")
+
+    assert first == second == [candidate]
+    assert mock_extract.call_count == 2
+
+
+@pytest.mark.unit
+@patch("pick_a_zoo.core.feed_discovery.fetch_html_with_playwright")
+def test_add_feed_screen_forbidden_body_scan_does_not_wait_for_playwright(mock_playwright):
+    """Test streams in a 403 body are used without waiting for the Playwright fallback."""
+    import threading
+    from unittest.mock import Mock, PropertyMock
+
+    browser_released = threading.Event()
+    mock_playwright.side_effect = lambda url, timeout: browser_released.wait(5) and ""
+    mock_app = Mock()
+    mock_app.call_from_thread.side_effect = lambda callback, *args: None
+
+    screen = AddFeedScreen()
+    with patch.object(AddFeedScreen, "app", new_callable=PropertyMock, return_value=mock_app):
+        recovered = screen._recover_from_forbidden(
+            "https://zoo.example.com/", '<video src="/cam.m3u8"></video>'
+        )
+    browser_released.set()
+
+    assert recovered is True
+    assert [c.url for c in screen.stream_candidates] == ["https://zoo.example.com/cam.m3u8"]
+    mock_app.call_from_thread.assert_called_with(
+        screen._save_direct_stream_feed, "https://zoo.example.com/cam.m3u8"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (
+            httpx.HTTPStatusError(
+                "Not Found",
+                request=httpx.Request("GET", "https://zoo.example.com/"),
+                response=httpx.Response(404),
+            ),
+            "Failed to fetch page: HTTP 404.",
+        ),
+        (httpx.ReadTimeout("timed out"), "Request timed out while fetching the page."),
+        (httpx.ConnectError("refused"), "Network error: refused."),
+        (RuntimeError("boom"), "An unexpected error occurred: boom."),
+    ],
+)
+def test_add_feed_screen_report_fetch_error_messages(error, expected):
+    """Test AddFeedScreen maps page fetch failures to user messages."""
+    from unittest.mock import Mock, PropertyMock
+
+    mock_app = Mock()
+    screen = AddFeedScreen()
+    with patch.object(AddFeedScreen, "app", new_callable=PropertyMock, return_value=mock_app):
+        screen._report_fetch_error(error)
+
+    callback, message = mock_app.call_from_thread.call_args.args
+    assert callback == screen._show_error
+    assert message.startswith(expected)
+
+
+@pytest.mark.unit
+@patch("pick_a_zoo.tui.screens.add_feed.store_cached_page")
+@patch("pick_a_zoo.tui.screens.add_feed.get_cached_page", return_value=None)
+def test_add_feed_screen_fetch_reports_streams_as_they_arrive(mock_get_cached, mock_store):
+    """Test the streamed fetch updates the status per chunk and records validators."""
+    from unittest.mock import Mock, PropertyMock
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        chunks = iter([b'<html><body><video src="/a.m3u8"></video>', b"<p>more</p></body></html>"])
+        return httpx.Response(200, headers={"ETag": '"v1"'}, content=chunks)
+
+    mock_app = Mock()
+    screen = AddFeedScreen()
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    with (
+        patch("pick_a_zoo.tui.screens.add_feed.get_http_client", return_value=client),
+        patch.object(AddFeedScreen, "app", new_callable=PropertyMock, return_value=mock_app),
+    ):
+        candidates = screen._fetch_streams_with_httpx("https://zoo.example.com/")
+
+    assert [c.url for c in candidates] == ["https://zoo.example.com/a.m3u8"]
+    mock_app.call_from_thread.assert_any_call(
+        screen._set_status, "Extracting streams from page... 1 found"
+    )
+    mock_store.assert_called_once_with(
+        "https://zoo.example.com/", etag='"v1"', last_modified=None, candidates=candidates
+    )
+
+
+@pytest.mark.unit
+@patch("pick_a_zoo.tui.screens.add_feed.store_cached_page")
+@patch("pick_a_zoo.tui.screens.add_feed.get_cached_page")
+def test_add_feed_screen_fetch_reuses_cached_streams_when_not_modified(mock_get_cached, mock_store):
+    """Test a 304 answer to the conditional GET reuses the cached candidates."""
+    from unittest.mock import Mock, PropertyMock
+
+    from pick_a_zoo.core.feed_discovery import StreamCandidate
+    from pick_a_zoo.core.page_cache import CachedPage
+
+    cached = StreamCandidate(url="https://zoo.example.com/a.m3u8", source_type="video_tag")
+    mock_get_cached.return_value = CachedPage(etag='"v1"', last_modified=None, candidates=(cached,))
+    seen_headers = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.update(request.headers)
+        return httpx.Response(304)
+
+    screen = AddFeedScreen()
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    with (
+        patch("pick_a_zoo.tui.screens.add_feed.get_http_client", return_value=client),
+        patch.object(AddFeedScreen, "app", new_callable=PropertyMock, return_value=Mock()),
+    ):
+        candidates = screen._fetch_streams_with_httpx("https://zoo.example.com/")
+
+    assert candidates == [cached]
+    assert seen_headers["if-none-match"] == '"v1"'
+    mock_store.assert_not_called()
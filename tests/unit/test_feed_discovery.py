@@ -1,65 +1,67 @@
 """Unit tests for feed_discovery module."""
 
-from unittest.mock import Mock, patch
+import threading
+from unittest.mock import patch
 
 import httpx
 import pytest
 
 from pick_a_zoo.core.feed_discovery import (
+    HTMLStreamExtractor,
     URLType,
     URLValidationError,
     URLValidationResult,
+    clear_url_caches,
     detect_url_type,
+    extract_streams_from_html,
+    get_http_client,
     validate_url_accessibility,
+    validate_urls_accessibility,
 )
 
 
 @pytest.mark.unit
-def test_detect_url_type_with_m3u8_direct_stream():
-    """Test detect_url_type() with direct stream URL (.m3u8)."""
-    url = "https://example.com/stream.m3u8"
-    result = detect_url_type(url)
-    assert result == URLType.DIRECT_STREAM
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/stream.m3u8",
+        "https://example.com/video.mp4",
+        "https://example.com/video.webm",
+        "rtsp://example.com/stream",
+        "RTMP://example.com/live",
+        "https://cdn.example.com/live/index.m3u8?token=abc&exp=1",
+        "https://example.com/video.mp4#t=10",
+        "https://example.com/segment-001.ts",
+    ],
+    ids=["m3u8", "mp4", "webm", "rtsp", "rtmp", "query", "fragment", "ts"],
+)
+def test_detect_url_type_with_direct_stream(url):
+    """Test detect_url_type() recognizes direct stream URLs without a request."""
+    assert detect_url_type(url) == URLType.DIRECT_STREAM
 
 
 @pytest.mark.unit
-def test_detect_url_type_with_mp4_direct_stream():
-    """Test detect_url_type() with direct stream URL (.mp4)."""
-    url = "https://example.com/video.mp4"
-    result = detect_url_type(url)
-    assert result == URLType.DIRECT_STREAM
-
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/video.mp4.html",
+        "https://example.com/watch?src=rtsp://cam.example.com/stream",
+        "https://example.com/posts",
+    ],
+    ids=["extension-mid-path", "scheme-in-query", "ts-suffix-without-dot"],
+)
+def test_detect_url_type_non_stream_lookalikes_use_head(mock_httpx_client, mock_head_response, url):
+    """Test URLs that only resemble direct streams fall through to the HEAD check."""
+    client = mock_httpx_client(head_return=mock_head_response(200, "text/html"))
 
-@pytest.mark.unit
-def test_detect_url_type_with_webm_direct_stream():
-    """Test detect_url_type() with direct stream URL (.webm)."""
-    url = "https://example.com/video.webm"
-    result = detect_url_type(url)
-    assert result == URLType.DIRECT_STREAM
+    assert detect_url_type(url) == URLType.HTML_PAGE
+    client.head.assert_called_once()
 
 
 @pytest.mark.unit
-def test_detect_url_type_with_rtsp_direct_stream():
-    """Test detect_url_type() with direct stream URL (rtsp://)."""
-    url = "rtsp://example.com/stream"
-    result = detect_url_type(url)
-    assert result == URLType.DIRECT_STREAM
-
-
-@pytest.mark.unit
-@patch("pick_a_zoo.core.feed_discovery.httpx.Client")
-def test_detect_url_type_with_html_page_via_content_type(mock_client_class):
+def test_detect_url_type_with_html_page_via_content_type(mock_httpx_client, mock_head_response):
     """Test detect_url_type() with HTML page URL (via Content-Type)."""
-    # Mock HTTP response with HTML Content-Type
-    mock_response = Mock()
-    mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
-    mock_response.history = []
-
-    mock_client = Mock()
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client.head.return_value = mock_response
-    mock_client_class.return_value = mock_client
+    mock_httpx_client(head_return=mock_head_response(200, "text/html; charset=utf-8"))
 
     url = "https://example.com/page.html"
     result = detect_url_type(url)
@@ -67,19 +69,10 @@ def test_detect_url_type_with_html_page_via_content_type(mock_client_class):
 
 
 @pytest.mark.unit
-@patch("pick_a_zoo.core.feed_discovery.httpx.Client")
-def test_detect_url_type_with_redirect_handling(mock_client_class):
+def test_detect_url_type_with_redirect_handling(mock_httpx_client, mock_head_response):
     """Test detect_url_type() with redirect handling."""
     # Mock HTTP response with redirects (but less than 5)
-    mock_response = Mock()
-    mock_response.headers = {"Content-Type": "text/html"}
-    mock_response.history = [Mock(), Mock()]  # 2 redirects
-
-    mock_client = Mock()
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client.head.return_value = mock_response
-    mock_client_class.return_value = mock_client
+    mock_httpx_client(head_return=mock_head_response(200, "text/html", redirects=2))
 
     url = "https://example.com/redirect"
     result = detect_url_type(url)
@@ -87,14 +80,9 @@ def test_detect_url_type_with_redirect_handling(mock_client_class):
 
 
 @pytest.mark.unit
-@patch("pick_a_zoo.core.feed_discovery.httpx.Client")
-def test_detect_url_type_error_handling_network_error(mock_client_class):
+def test_detect_url_type_error_handling_network_error(mock_httpx_client):
     """Test detect_url_type() error handling (network error)."""
-    mock_client = Mock()
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client.head.side_effect = httpx.NetworkError("Connection failed")
-    mock_client_class.return_value = mock_client
+    mock_httpx_client(head_side_effect=httpx.NetworkError("Connection failed"))
 
     # Use a URL that doesn't match direct stream patterns to force HTTP request
     url = "https://example.com/page"
@@ -104,19 +92,9 @@ def test_detect_url_type_error_handling_network_error(mock_client_class):
 
 
 @pytest.mark.unit
-@patch("pick_a_zoo.core.feed_discovery.httpx.Client")
-def test_validate_url_accessibility_with_accessible_url(mock_client_class):
+def test_validate_url_accessibility_with_accessible_url(mock_httpx_client, mock_head_response):
     """Test validate_url_accessibility() with accessible URL."""
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.headers = {"Content-Type": "video/mp4"}
-    mock_response.history = []
-
-    mock_client = Mock()
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client.head.return_value = mock_response
-    mock_client_class.return_value = mock_client
+    mock_httpx_client(head_return=mock_head_response(200, "video/mp4"))
 
     url = "https://example.com/stream.mp4"
     result = validate_url_accessibility(url)
@@ -128,19 +106,11 @@ def test_validate_url_accessibility_with_accessible_url(mock_client_class):
 
 
 @pytest.mark.unit
-@patch("pick_a_zoo.core.feed_discovery.httpx.Client")
-def test_validate_url_accessibility_with_inaccessible_url_404(mock_client_class):
+def test_validate_url_accessibility_with_inaccessible_url_404(
+    mock_httpx_client, mock_head_response
+):
     """Test validate_url_accessibility() with inaccessible URL (404)."""
-    mock_response = Mock()
-    mock_response.status_code = 404
-    mock_response.headers = {"Content-Type": "text/html"}
-    mock_response.history = []
-
-    mock_client = Mock()
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client.head.return_value = mock_response
-    mock_client_class.return_value = mock_client
+    mock_httpx_client(head_return=mock_head_response(404, "text/html"))
 
     url = "https://example.com/notfound.mp4"
     result = validate_url_accessibility(url)
@@ -151,54 +121,218 @@ def test_validate_url_accessibility_with_inaccessible_url_404(mock_client_class)
 
 
 @pytest.mark.unit
-@patch("pick_a_zoo.core.feed_discovery.httpx.Client")
-def test_validate_url_accessibility_with_timeout_scenario(mock_client_class):
-    """Test validate_url_accessibility() with timeout scenario."""
-    mock_client = Mock()
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client.head.side_effect = httpx.TimeoutException("Request timed out")
-    mock_client_class.return_value = mock_client
-
-    url = "https://example.com/slow.mp4"
-    with pytest.raises(URLValidationError) as exc_info:
-        validate_url_accessibility(url, timeout=5.0)
-    assert "Timeout" in str(exc_info.value)
-    assert "5.0" in str(exc_info.value.user_message)
-
-
-@pytest.mark.unit
-@patch("pick_a_zoo.core.feed_discovery.httpx.Client")
-def test_validate_url_accessibility_with_network_error(mock_client_class):
-    """Test validate_url_accessibility() with network error."""
-    mock_client = Mock()
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client.head.side_effect = httpx.ConnectError("Connection refused")
-    mock_client_class.return_value = mock_client
+@pytest.mark.parametrize(
+    ("error", "expected_message", "expected_user_message"),
+    [
+        (httpx.TimeoutException("Request timed out"), "Timeout", "5.0"),
+        (httpx.ConnectError("Connection refused"), "Connection error", None),
+    ],
+    ids=["timeout", "network-error"],
+)
+def test_validate_url_accessibility_request_failures(
+    mock_httpx_client, error, expected_message, expected_user_message
+):
+    """Test validate_url_accessibility() raises URLValidationError on request failures."""
+    mock_httpx_client(head_side_effect=error)
 
     url = "https://example.com/unreachable.mp4"
     with pytest.raises(URLValidationError) as exc_info:
-        validate_url_accessibility(url)
-    assert "Connection error" in str(exc_info.value)
+        validate_url_accessibility(url, timeout=5.0)
+    assert expected_message in str(exc_info.value)
+    if expected_user_message is not None:
+        assert expected_user_message in str(exc_info.value.user_message)
 
 
 @pytest.mark.unit
-@patch("pick_a_zoo.core.feed_discovery.httpx.Client")
-def test_validate_url_accessibility_with_redirect_handling(mock_client_class):
+def test_validate_url_accessibility_with_redirect_handling(mock_httpx_client, mock_head_response):
     """Test validate_url_accessibility() with redirect handling."""
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.headers = {"Content-Type": "video/mp4"}
-    mock_response.history = [Mock(), Mock()]  # 2 redirects
-
-    mock_client = Mock()
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client.head.return_value = mock_response
-    mock_client_class.return_value = mock_client
+    mock_httpx_client(head_return=mock_head_response(200, "video/mp4", redirects=2))
 
     url = "https://example.com/redirect.mp4"
     result = validate_url_accessibility(url)
     assert result.is_accessible is True
     assert result.status_code == 200
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("refused_status", [403, 405])
+def test_validate_url_accessibility_retries_refused_head_as_ranged_get(
+    mock_httpx_client, mock_head_response, refused_status
+):
+    """Test a refused HEAD is retried as a one-byte streamed GET."""
+    client = mock_httpx_client(
+        head_return=mock_head_response(refused_status, "text/html"),
+        get_return=mock_head_response(206, "video/mp4"),
+    )
+
+    result = validate_url_accessibility("https://example.com/stream.mp4")
+
+    assert result.is_accessible is True
+    assert result.status_code == 206
+    method, url = client.stream.call_args.args
+    assert (method, url) == ("GET", "https://example.com/stream.mp4")
+    assert client.stream.call_args.kwargs["headers"]["Range"] == "bytes=0-0"
+
+
+@pytest.mark.unit
+def test_validate_url_accessibility_skips_get_when_head_succeeds(
+    mock_httpx_client, mock_head_response
+):
+    """Test no GET is sent when HEAD answers, even with an error status."""
+    client = mock_httpx_client(head_return=mock_head_response(404, "text/html"))
+
+    validate_url_accessibility("https://example.com/missing.mp4")
+
+    client.stream.assert_not_called()
+
+
+@pytest.mark.unit
+def test_url_results_are_cached_until_cleared(mock_httpx_client, mock_head_response):
+    """Test detection and successful validation are reused until clear_url_caches()."""
+    client = mock_httpx_client(head_return=mock_head_response(200, "text/html"))
+    url = "https://example.com/page"
+
+    assert detect_url_type(url) == URLType.HTML_PAGE
+    assert detect_url_type(url) == URLType.HTML_PAGE
+    assert validate_url_accessibility(url).is_accessible is True
+    assert validate_url_accessibility(url).is_accessible is True
+    assert client.head.call_count == 2
+
+    clear_url_caches()
+    detect_url_type(url)
+    validate_url_accessibility(url)
+    assert client.head.call_count == 4
+
+
+@pytest.mark.unit
+def test_validate_url_accessibility_does_not_cache_failures(mock_httpx_client, mock_head_response):
+    """Test an inaccessible URL is probed again on the next validation."""
+    client = mock_httpx_client(head_return=mock_head_response(503, "text/html"))
+    url = "https://example.com/down.mp4"
+
+    assert validate_url_accessibility(url).is_accessible is False
+    client.head.return_value = mock_head_response(200, "video/mp4")
+    assert validate_url_accessibility(url).is_accessible is True
+    assert client.head.call_count == 2
+
+
+@pytest.mark.unit
+def test_validate_urls_accessibility_probes_concurrently(mock_httpx_client, mock_head_response):
+    """Test validate_urls_accessibility() runs HEAD probes in parallel and maps each URL."""
+    # Every probe waits for the others, so a sequential implementation would time out
+    barrier = threading.Barrier(3, timeout=5.0)
+    responses = {
+        "https://example.com/a.mp4": mock_head_response(200, "video/mp4"),
+        "https://example.com/b.mp4": mock_head_response(404, "text/html"),
+    }
+
+    def head(url, **kwargs):
+        barrier.wait()
+        if url not in responses:
+            raise httpx.ConnectError("Connection refused")
+        return responses[url]
+
+    client = mock_httpx_client(head_side_effect=head)
+
+    urls = [
+        "https://example.com/a.mp4",
+        "https://example.com/b.mp4",
+        "https://example.com/c.mp4",
+        "https://example.com/a.mp4",
+    ]
+    results = validate_urls_accessibility(urls)
+
+    assert list(results) == urls[:3]
+    assert results["https://example.com/a.mp4"].is_accessible is True
+    assert results["https://example.com/b.mp4"].error_message == "HTTP 404"
+    assert results["https://example.com/c.mp4"].is_accessible is False
+    assert "connect" in results["https://example.com/c.mp4"].error_message
+    assert client.head.call_count == 3
+
+
+@pytest.mark.unit
+@patch("pick_a_zoo.core.feed_discovery._http_client", None)
+@patch("pick_a_zoo.core.feed_discovery.atexit.register")
+@patch("pick_a_zoo.core.feed_discovery.httpx.Client")
+def test_get_http_client_reuses_single_client(mock_client_class, mock_register):
+    """Test get_http_client() creates one pooled client and reuses it."""
+    first = get_http_client()
+    second = get_http_client()
+
+    assert first is second
+    mock_client_class.assert_called_once()
+    assert mock_client_class.call_args.kwargs["follow_redirects"] is True
+    mock_register.assert_called_once_with(first.close)
+
+
+@pytest.mark.unit
+def test_extract_streams_from_html_video_and_source_tags():
+    """Test extract_streams_from_html() resolves <video> and <source> URLs."""
+    html = """
+    <html><body>
+      <video src="/live/main.m3u8">
+        <source src="backup.mp4" srcset="low.webm 1x, high.webm 2x">
+      </video>
+    </body></html>
+    """
+    streams = extract_streams_from_html(html, "https://zoo.example.com/cams/")
+    assert [(s.url, s.source_type) for s in streams] == [
+        ("https://zoo.example.com/live/main.m3u8", "video_tag"),
+        ("https://zoo.example.com/cams/backup.mp4", "source_tag"),
+        ("https://zoo.example.com/cams/low.webm", "source_tag"),
+        ("https://zoo.example.com/cams/high.webm", "source_tag"),
+    ]
+
+
+@pytest.mark.unit
+def test_extract_streams_from_html_text_and_script_links():
+    """Test extract_streams_from_html() labels page text and script links separately."""
+    html = """<?xml version="1.0" encoding="UTF-8"?>
+    <html><body>
+      <p>Watch at https://cdn.example.com/otter.m3u8 now</p>
+      <img src="https://cdn.example.com/poster.mp4.jpg">
+      <script>var stream = "https://cdn.example.com/panda.m3u8?token=1";</script>
+      <!-- https://cdn.example.com/hidden.mp4 -->
+    </body></html>
+    """
+    streams = extract_streams_from_html(html, "https://zoo.example.com/")
+    assert [(s.url, s.source_type) for s in streams] == [
+        ("https://cdn.example.com/otter.m3u8", "m3u8_link"),
+        ("https://cdn.example.com/panda.m3u8?token=1", "script_m3u8_link"),
+    ]
+
+
+@pytest.mark.unit
+def test_extract_streams_from_html_empty_content():
+    """Test extract_streams_from_html() returns no streams for an empty page."""
+    assert extract_streams_from_html("", "https://zoo.example.com/") == []
+
+
+@pytest.mark.unit
+def test_html_stream_extractor_matches_whole_document_scan():
+    """Test HTMLStreamExtractor gives the same result when fed byte by byte."""
+    html = (
+        "<html><body><p>Live: https://cdn.example.com/otter.m3u8</p>"
+        "<script>load('https://cdn.example.com/panda.mp4');</script>"
+        '<video src="cam.m3u8"></video></body></html>'
+    )
+    extractor = HTMLStreamExtractor("https://zoo.example.com/")
+    for i in range(len(html)):
+        extractor.feed(html[i : i + 1].encode())
+    streams = extractor.close()
+
+    assert streams == extract_streams_from_html(html, "https://zoo.example.com/")
+    assert [s.source_type for s in streams] == ["video_tag", "m3u8_link", "script_mp4_link"]
+
+
+@pytest.mark.unit
+def test_extract_streams_from_html_stops_at_max_candidates():
+    """Test extract_streams_from_html() stops once max_candidates are found."""
+    videos = "".join(f'<video src="/cam{i}.m3u8"></video>' for i in range(20))
+    html = f"<html><body>{videos}</body></html>"
+
+    capped = extract_streams_from_html(html, "https://zoo.example.com/", max_candidates=3)
+    uncapped = extract_streams_from_html(html, "https://zoo.example.com/", max_candidates=None)
+
+    assert [s.url for s in capped] == [f"https://zoo.example.com/cam{i}.m3u8" for i in range(3)]
+    assert len(uncapped) == 20
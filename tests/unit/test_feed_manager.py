@@ -6,9 +6,48 @@ from unittest.mock import patch
 import pytest
 import yaml
 
-from pick_a_zoo.core.feed_manager import get_config_path, load_feeds, save_feeds
+from pick_a_zoo.core.feed_manager import (
+    append_feed,
+    get_config_mtime_ns,
+    get_config_path,
+    load_feeds,
+    save_feeds,
+)
 from pick_a_zoo.core.models import Feed, WindowSize
 
+# Same loader/dumper preference as feed_manager: libyaml when available
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
+
+# Bytes save_feeds must write for the Panda Cam / Otter Live pair
+_EXPECTED_SAVED_FEEDS = yaml.dump(
+    {
+        "feeds": [
+            {"name": "Panda Cam", "url": "https://example.org/panda.m3u8", "window_size": None},
+            {
+                "name": "Otter Live",
+                "url": "https://example.org/otter.mp4",
+                "window_size": {"width": 1280, "height": 720},
+            },
+        ]
+    },
+    Dumper=_Dumper,
+    default_flow_style=False,
+    sort_keys=False,
+).encode("utf-8")
+
+
+@pytest.fixture
+def config_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point feed_manager at a feeds.yaml inside tmp_path for the duration of a test."""
+    path = tmp_path / "feeds.yaml"
+    monkeypatch.setattr("pick_a_zoo.core.feed_manager.get_config_path", lambda: path)
+    return path
+
 
 @pytest.mark.unit
 def test_get_config_path():
@@ -20,10 +59,8 @@ def test_get_config_path():
 
 
 @pytest.mark.unit
-def test_load_feeds_with_valid_yaml(tmp_path: Path):
+def test_load_feeds_with_valid_yaml(config_file: Path):
     """Test loading feeds from a valid YAML file."""
-    # Create a temporary config file
-    config_file = tmp_path / "feeds.yaml"
     feeds_data = {
         "feeds": [
             {"name": "Panda Cam", "url": "https://example.org/panda.m3u8"},
@@ -35,10 +72,9 @@ def test_load_feeds_with_valid_yaml(tmp_path: Path):
         ]
     }
     with config_file.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(feeds_data, f)
+        yaml.dump(feeds_data, f, Dumper=_Dumper)
 
-    with patch("pick_a_zoo.core.feed_manager.get_config_path", return_value=config_file):
-        feeds = load_feeds()
+    feeds = load_feeds()
 
     assert len(feeds) == 2
     assert feeds[0].name == "Panda Cam"
@@ -52,44 +88,38 @@ def test_load_feeds_with_valid_yaml(tmp_path: Path):
 
 
 @pytest.mark.unit
-def test_load_feeds_with_missing_file(tmp_path: Path):
+def test_load_feeds_with_missing_file(config_file: Path):
     """Test that missing file creates empty file and returns empty list."""
-    config_file = tmp_path / "feeds.yaml"
-
-    with patch("pick_a_zoo.core.feed_manager.get_config_path", return_value=config_file):
-        feeds = load_feeds()
+    feeds = load_feeds()
 
     assert feeds == []
     assert config_file.exists()
 
     # Verify the file has the correct structure
     with config_file.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_Loader)
         assert data == {"feeds": []}
 
 
 @pytest.mark.unit
-def test_load_feeds_with_corrupted_yaml_file(tmp_path: Path):
+def test_load_feeds_with_corrupted_yaml_file(config_file: Path):
     """Test that corrupted YAML file is rebuilt and returns empty list."""
-    config_file = tmp_path / "feeds.yaml"
     # Write invalid YAML
     config_file.write_text("invalid: yaml: content: [", encoding="utf-8")
 
-    with patch("pick_a_zoo.core.feed_manager.get_config_path", return_value=config_file):
-        feeds = load_feeds()
+    feeds = load_feeds()
 
     assert feeds == []
 
     # Verify the file was rebuilt with correct structure
     with config_file.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_Loader)
         assert data == {"feeds": []}
 
 
 @pytest.mark.unit
-def test_save_feeds_with_valid_feeds_list(tmp_path: Path):
+def test_save_feeds_with_valid_feeds_list(config_file: Path):
     """Test saving a valid list of feeds."""
-    config_file = tmp_path / "feeds.yaml"
     feeds = [
         Feed(name="Panda Cam", url="https://example.org/panda.m3u8"),
         Feed(
@@ -99,73 +129,118 @@ def test_save_feeds_with_valid_feeds_list(tmp_path: Path):
         ),
     ]
 
-    with patch("pick_a_zoo.core.feed_manager.get_config_path", return_value=config_file):
-        save_feeds(feeds)
+    save_feeds(feeds)
 
-    assert config_file.exists()
-
-    # Verify the saved data
-    with config_file.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-        assert len(data["feeds"]) == 2
-        assert data["feeds"][0]["name"] == "Panda Cam"
-        assert data["feeds"][0]["url"] == "https://example.org/panda.m3u8"
-        assert data["feeds"][1]["name"] == "Otter Live"
-        assert data["feeds"][1]["window_size"]["width"] == 1280
+    # save_feeds keeps model field order, so the file is byte-for-byte predictable
+    assert config_file.read_bytes() == _EXPECTED_SAVED_FEEDS
 
 
 @pytest.mark.unit
-def test_save_feeds_atomic_write_pattern(tmp_path: Path):
+def test_save_feeds_atomic_write_pattern(config_file: Path):
     """Test that save_feeds uses atomic write pattern."""
-    config_file = tmp_path / "feeds.yaml"
     feeds = [Feed(name="Test Cam", url="https://example.org/test.m3u8")]
 
-    with patch("pick_a_zoo.core.feed_manager.get_config_path", return_value=config_file):
-        save_feeds(feeds)
+    save_feeds(feeds)
 
     # Verify file exists and is valid
     assert config_file.exists()
     with config_file.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_Loader)
         assert len(data["feeds"]) == 1
 
 
 @pytest.mark.unit
-def test_load_feeds_with_invalid_structure(tmp_path: Path):
+def test_append_feed_appends_to_saved_file(config_file: Path):
+    """Test append_feed adds an entry in place to a file written by save_feeds."""
+    existing = [Feed(name="Panda Cam", url="https://example.org/panda.m3u8")]
+    new_feed = Feed(
+        name="Otter Live",
+        url="https://example.org/otter.mp4",
+        window_size=WindowSize(width=1280, height=720),
+    )
+
+    save_feeds(existing)
+    before = config_file.read_text(encoding="utf-8")
+    with patch("pick_a_zoo.core.feed_manager.save_feeds") as mock_save_feeds:
+        append_feed(new_feed)
+    feeds = load_feeds()
+
+    mock_save_feeds.assert_not_called()
+    assert config_file.read_text(encoding="utf-8").startswith(before)
+    assert [feed.name for feed in feeds] == ["Panda Cam", "Otter Live"]
+    assert feeds[1].window_size == WindowSize(width=1280, height=720)
+
+
+@pytest.mark.unit
+def test_append_feed_rewrites_empty_flow_style_list(config_file: Path):
+    """Test append_feed falls back to a full rewrite when the file cannot be appended to."""
+    config_file.write_text("feeds: []\n", encoding="utf-8")
+
+    append_feed(Feed(name="Panda Cam", url="https://example.org/panda.m3u8"))
+    feeds = load_feeds()
+
+    assert [feed.name for feed in feeds] == ["Panda Cam"]
+
+
+@pytest.mark.unit
+def test_append_feed_rewrites_indented_list(config_file: Path):
+    """Test append_feed rewrites a hand-edited indented list instead of breaking it."""
+    config_file.write_text(
+        "feeds:\n  - name: Panda Cam\n    url: https://example.org/panda.m3u8\n",
+        encoding="utf-8",
+    )
+
+    append_feed(Feed(name="Otter Live", url="https://example.org/otter.mp4"))
+    feeds = load_feeds()
+
+    assert [feed.name for feed in feeds] == ["Panda Cam", "Otter Live"]
+
+
+@pytest.mark.unit
+def test_append_feed_rewrites_config_with_trailing_top_level_key(config_file: Path):
+    """Test append_feed never appends under a top-level key that follows the feeds list."""
+    config_file.write_text(
+        "feeds:\n- name: Panda Cam\n  url: https://example.org/panda.m3u8\nsettings:\n  x: 1\n",
+        encoding="utf-8",
+    )
+
+    append_feed(Feed(name="Otter Live", url="https://example.org/otter.mp4"))
+    feeds = load_feeds()
+
+    assert [feed.name for feed in feeds] == ["Panda Cam", "Otter Live"]
+
+
+@pytest.mark.unit
+def test_load_feeds_with_invalid_structure(config_file: Path):
     """Test loading feeds from file with invalid structure."""
-    config_file = tmp_path / "feeds.yaml"
     # Write YAML with invalid structure (feeds is not a list)
     invalid_data = {"feeds": "not a list"}
     with config_file.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(invalid_data, f)
+        yaml.dump(invalid_data, f, Dumper=_Dumper)
 
-    with patch("pick_a_zoo.core.feed_manager.get_config_path", return_value=config_file):
-        feeds = load_feeds()
+    feeds = load_feeds()
 
     assert feeds == []
 
     # Verify file was rebuilt
     with config_file.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_Loader)
         assert data == {"feeds": []}
 
 
 @pytest.mark.unit
-def test_load_feeds_with_empty_file(tmp_path: Path):
+def test_load_feeds_with_empty_file(config_file: Path):
     """Test loading from an empty YAML file."""
-    config_file = tmp_path / "feeds.yaml"
     config_file.write_text("", encoding="utf-8")
 
-    with patch("pick_a_zoo.core.feed_manager.get_config_path", return_value=config_file):
-        feeds = load_feeds()
+    feeds = load_feeds()
 
     assert feeds == []
 
 
 @pytest.mark.unit
-def test_load_feeds_with_invalid_feed_entry(tmp_path: Path):
+def test_load_feeds_with_invalid_feed_entry(config_file: Path):
     """Test that invalid feed entries are skipped."""
-    config_file = tmp_path / "feeds.yaml"
     feeds_data = {
         "feeds": [
             {"name": "Valid Feed", "url": "https://example.org/valid.m3u8"},
@@ -174,10 +249,9 @@ def test_load_feeds_with_invalid_feed_entry(tmp_path: Path):
         ]
     }
     with config_file.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(feeds_data, f)
+        yaml.dump(feeds_data, f, Dumper=_Dumper)
 
-    with patch("pick_a_zoo.core.feed_manager.get_config_path", return_value=config_file):
-        feeds = load_feeds()
+    feeds = load_feeds()
 
     # Only the valid feed should be loaded
     assert len(feeds) == 1
@@ -238,3 +312,11 @@ def test_resolve_duplicate_name_edge_case_with_existing_number_suffix():
     # When resolving "Panda Cam (2)", it should extract base name and increment
     result = resolve_duplicate_name("Panda Cam (2)", existing_feeds)
     assert result == "Panda Cam (3)"
+
+
+@pytest.mark.unit
+def test_get_config_mtime_ns(config_file: Path):
+    """Test get_config_mtime_ns returns the file mtime, or None if it is missing."""
+    assert get_config_mtime_ns() is None
+    config_file.write_text("feeds: []\n", encoding="utf-8")
+    assert get_config_mtime_ns() == config_file.stat().st_mtime_ns
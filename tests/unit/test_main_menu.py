@@ -1,12 +1,18 @@
 """Unit tests for MainMenuScreen."""
 
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
 import pytest
 
 from pick_a_zoo.tui.screens.main_menu import MainMenuScreen
 
 
+@pytest.fixture(scope="module")
+def menu_keys() -> frozenset[str]:
+    """Keys bound on MainMenuScreen, collected once for membership checks."""
+    return frozenset(binding[0] for binding in MainMenuScreen.BINDINGS)
+
+
 @pytest.mark.unit
 def test_main_menu_screen_rendering():
     """Test that MainMenuScreen renders correctly."""
@@ -17,13 +23,9 @@ def test_main_menu_screen_rendering():
 
 
 @pytest.mark.unit
-def test_main_menu_screen_keyboard_navigation_arrow_keys():
+def test_main_menu_screen_keyboard_navigation_arrow_keys(menu_keys: frozenset[str]):
     """Test MainMenuScreen has arrow key navigation bindings."""
-    screen = MainMenuScreen()
-    # Verify bindings exist for arrow keys
-    bindings = [b[0] for b in screen.BINDINGS]
-    assert "up" in bindings
-    assert "down" in bindings
+    assert {"up", "down"} <= menu_keys
 
 
 @pytest.mark.unit
@@ -36,32 +38,21 @@ def test_main_menu_screen_wasd_fallback_navigation():
 
 
 @pytest.mark.unit
-def test_main_menu_screen_hotkey_shortcuts():
-    """Test MainMenuScreen has hotkey shortcuts."""
-    screen = MainMenuScreen()
-    bindings = [b[0] for b in screen.BINDINGS]
-    # Verify number hotkeys
-    assert "1" in bindings
-    assert "2" in bindings
-    assert "3" in bindings
-    assert "4" in bindings
-    # Verify letter hotkeys
-    assert "v" in bindings
-    assert "a" in bindings
-    assert "w" in bindings
-    assert "q" in bindings
+def test_main_menu_screen_hotkey_shortcuts(menu_keys: frozenset[str]):
+    """Test MainMenuScreen has number and letter hotkey shortcuts."""
+    assert {"1", "2", "3", "4", "v", "a", "w", "q"} <= menu_keys
 
 
 @pytest.mark.unit
-def test_main_menu_screen_quit_action():
+def test_main_menu_screen_quit_action(menu_keys: frozenset[str]):
     """Test MainMenuScreen has quit action."""
     screen = MainMenuScreen()
     assert hasattr(screen, "action_quit")
-    assert "q" in [b[0] for b in screen.BINDINGS]
+    assert "q" in menu_keys
 
 
 @pytest.mark.unit
-@patch("pick_a_zoo.tui.screens.main_menu.load_feeds")
+@patch("pick_a_zoo.tui.app.load_feeds")
 def test_main_menu_screen_display_no_cams_saved_yet_message(mock_load_feeds):
     """Test MainMenuScreen displays 'No cams saved yet' message when no feeds exist."""
     mock_load_feeds.return_value = []
@@ -72,7 +63,7 @@ def test_main_menu_screen_display_no_cams_saved_yet_message(mock_load_feeds):
 
 
 @pytest.mark.unit
-@patch("pick_a_zoo.tui.screens.main_menu.load_feeds")
+@patch("pick_a_zoo.tui.app.load_feeds")
 def test_main_menu_screen_terminal_size_warning(mock_load_feeds):
     """Test MainMenuScreen has terminal size warning functionality."""
     mock_load_feeds.return_value = []
@@ -82,3 +73,45 @@ def test_main_menu_screen_terminal_size_warning(mock_load_feeds):
     assert hasattr(screen, "_check_terminal_size")
     assert screen.MIN_TERMINAL_WIDTH == 80
     assert screen.MIN_TERMINAL_HEIGHT == 24
+
+
+@pytest.mark.unit
+def test_main_menu_option_handlers_cover_menu_options():
+    """Test every menu option id has a dispatch handler."""
+    assert set(MainMenuScreen._OPTION_HANDLERS) == {
+        option_id for _, option_id, _ in MainMenuScreen.MENU_OPTIONS
+    }
+    for handler_name in MainMenuScreen._OPTION_HANDLERS.values():
+        assert callable(getattr(MainMenuScreen, handler_name))
+
+
+@pytest.mark.unit
+def test_action_select_option_by_id_uses_subclass_override():
+    """Test dispatch calls handlers through the instance, so overrides take effect."""
+    calls = []
+
+    class CustomMenu(MainMenuScreen):
+        def _open_add_feed(self) -> None:
+            calls.append("add")
+
+    CustomMenu().action_select_option_by_id("add")
+
+    assert calls == ["add"]
+
+
+@pytest.mark.unit
+@patch("pick_a_zoo.tui.screens.view_saved_cams.ViewSavedCamsScreen")
+@patch("textual.screen.Screen.app", new_callable=PropertyMock)
+def test_action_select_option_by_id_dispatches(mock_app_prop, mock_view_screen):
+    """Test option ids route to their handler and unknown ids are ignored."""
+    screen = MainMenuScreen()
+    app = mock_app_prop.return_value
+
+    screen.action_select_option_by_id("view")
+    app.push_screen.assert_called_once_with(mock_view_screen.return_value)
+
+    screen.action_select_option_by_id("bogus")
+    app.push_screen.assert_called_once()
+
+    screen.action_select_option_by_id("quit")
+    app.exit.assert_called_once()
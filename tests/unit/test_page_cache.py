@@ -0,0 +1,90 @@
+"""Unit tests for page_cache module."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pick_a_zoo.core.feed_discovery import StreamCandidate
+from pick_a_zoo.core.page_cache import (
+    MAX_CACHED_PAGES,
+    get_cached_page,
+    store_cached_page,
+)
+
+
+@pytest.mark.unit
+def test_store_and_get_cached_page_round_trip(tmp_path: Path):
+    """Test stored validators and candidates are returned with conditional headers."""
+    cache_file = tmp_path / "page_cache.yaml"
+    candidates = [StreamCandidate(url="https://zoo.example.com/cam.m3u8", source_type="video_tag")]
+
+    with patch("pick_a_zoo.core.page_cache.get_cache_path", return_value=cache_file):
+        store_cached_page(
+            "https://zoo.example.com/",
+            etag='"abc123"',
+            last_modified="Tue, 13 Oct 2026 10:00:00 GMT",
+            candidates=candidates,
+        )
+        page = get_cached_page("https://zoo.example.com/")
+
+    assert page is not None
+    assert list(page.candidates) == candidates
+    assert page.conditional_headers() == {
+        "If-None-Match": '"abc123"',
+        "If-Modified-Since": "Tue, 13 Oct 2026 10:00:00 GMT",
+    }
+
+
+@pytest.mark.unit
+def test_store_cached_page_skips_pages_without_validators(tmp_path: Path):
+    """Test pages without ETag or Last-Modified are not cached."""
+    cache_file = tmp_path / "page_cache.yaml"
+
+    with patch("pick_a_zoo.core.page_cache.get_cache_path", return_value=cache_file):
+        store_cached_page("https://zoo.example.com/", etag=None, last_modified=None, candidates=[])
+        assert get_cached_page("https://zoo.example.com/") is None
+
+    assert not cache_file.exists()
+
+
+@pytest.mark.unit
+def test_store_cached_page_evicts_oldest_entries(tmp_path: Path):
+    """Test the cache keeps at most MAX_CACHED_PAGES entries, dropping the oldest."""
+    cache_file = tmp_path / "page_cache.yaml"
+
+    with patch("pick_a_zoo.core.page_cache.get_cache_path", return_value=cache_file):
+        for i in range(MAX_CACHED_PAGES + 1):
+            store_cached_page(
+                f"https://zoo{i}.example.com/", etag=f'"{i}"', last_modified=None, candidates=[]
+            )
+
+        assert get_cached_page("https://zoo0.example.com/") is None
+        assert get_cached_page(f"https://zoo{MAX_CACHED_PAGES}.example.com/") is not None
+
+
+@pytest.mark.unit
+def test_get_cached_page_ignores_corrupt_cache(tmp_path: Path):
+    """Test an unreadable cache file is treated as a miss."""
+    cache_file = tmp_path / "page_cache.yaml"
+    cache_file.write_text("{not: [valid yaml", encoding="utf-8")
+
+    with patch("pick_a_zoo.core.page_cache.get_cache_path", return_value=cache_file):
+        assert get_cached_page("https://zoo.example.com/") is None
+
+
+@pytest.mark.unit
+def test_store_cached_page_removes_temp_file_when_replace_fails(tmp_path: Path):
+    """Test a failed atomic rename leaves no temporary file behind."""
+    cache_file = tmp_path / "page_cache.yaml"
+    candidates = [StreamCandidate(url="https://zoo.example.com/cam.m3u8", source_type="video_tag")]
+
+    with (
+        patch("pick_a_zoo.core.page_cache.get_cache_path", return_value=cache_file),
+        patch("pick_a_zoo.core.page_cache.os.replace", side_effect=OSError("disk full")),
+    ):
+        store_cached_page(
+            "https://zoo.example.com/", etag='"abc123"', last_modified=None, candidates=candidates
+        )
+
+    assert list(tmp_path.iterdir()) == []
@@ -1,5 +1,9 @@
 """Unit tests for video_player module."""
 
+import threading
+import time
+from unittest.mock import Mock
+
 import pytest
 
 from pick_a_zoo.core.video_player import (
@@ -9,6 +13,7 @@ from pick_a_zoo.core.video_player import (
     MAX_WINDOW_WIDTH,
     MIN_WINDOW_HEIGHT,
     MIN_WINDOW_WIDTH,
+    FrameProducer,
     StreamLoadError,
     VideoFrame,
     VideoPlayer,
@@ -16,6 +21,12 @@ from pick_a_zoo.core.video_player import (
 )
 
 
+@pytest.fixture(scope="module")
+def idle_player() -> VideoPlayer:
+    """Player whose stream is never loaded, shared by tests that only assert idle behavior."""
+    return VideoPlayer("https://example.org/stream.m3u8")
+
+
 @pytest.mark.unit
 def test_video_player_init():
     """Test VideoPlayer.__init__() with valid stream URL."""
@@ -52,44 +63,39 @@ def test_video_player_load_valid_stream():
 
 
 @pytest.mark.unit
-def test_video_player_play():
+def test_video_player_play(idle_player: VideoPlayer):
     """Test VideoPlayer.play() raises VideoPlayerError when stream not loaded."""
-    player = VideoPlayer("https://example.org/stream.m3u8")
     # play() should raise VideoPlayerError when stream not loaded
     with pytest.raises(VideoPlayerError, match="Stream not loaded"):
-        player.play()
+        idle_player.play()
 
 
 @pytest.mark.unit
-def test_video_player_get_frame():
+def test_video_player_get_frame(idle_player: VideoPlayer):
     """Test VideoPlayer.get_frame() returns None when stream not loaded."""
-    player = VideoPlayer("https://example.org/stream.m3u8")
     # get_frame() should return None when stream not loaded
-    frame = player.get_frame()
+    frame = idle_player.get_frame()
     assert frame is None
 
 
 @pytest.mark.unit
-def test_video_player_stop():
+def test_video_player_stop(idle_player: VideoPlayer):
     """Test VideoPlayer.stop() works even when not playing."""
-    player = VideoPlayer("https://example.org/stream.m3u8")
     # stop() should work without raising an error
-    player.stop()
-    assert not player.is_playing()
+    idle_player.stop()
+    assert not idle_player.is_playing()
 
 
 @pytest.mark.unit
-def test_video_player_is_playing():
+def test_video_player_is_playing(idle_player: VideoPlayer):
     """Test VideoPlayer.is_playing() returns False initially."""
-    player = VideoPlayer("https://example.org/stream.m3u8")
-    assert not player.is_playing()
+    assert not idle_player.is_playing()
 
 
 @pytest.mark.unit
-def test_video_player_get_error():
+def test_video_player_get_error(idle_player: VideoPlayer):
     """Test VideoPlayer.get_error() returns None initially."""
-    player = VideoPlayer("https://example.org/stream.m3u8")
-    assert player.get_error() is None
+    assert idle_player.get_error() is None
 
 
 @pytest.mark.unit
@@ -128,3 +134,85 @@ def test_stream_load_error():
     assert error.message == "Stream unavailable"
     assert error.error_type == "unavailable"
     assert isinstance(error, VideoPlayerError)
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    """Poll condition until it is true or timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+@pytest.mark.unit
+def test_frame_producer_keeps_one_frame_in_flight():
+    """Test FrameProducer waits for the consumer before fetching the next frame."""
+    frame = VideoFrame(pixels=b"test", width=1280, height=720, timestamp=1.0)
+    player = Mock()
+    player.get_frame.return_value = frame
+
+    producer = FrameProducer(player)
+    producer.start()
+    try:
+        assert _wait_for(lambda: player.get_frame.call_count == 1)
+        # Producer must not fetch again until the consumer is ready
+        time.sleep(0.05)
+        assert player.get_frame.call_count == 1
+
+        assert producer.take_frame() is frame
+        assert producer.take_frame() is None
+
+        producer.mark_ready()
+        assert _wait_for(lambda: player.get_frame.call_count == 2)
+    finally:
+        producer.stop()
+
+
+@pytest.mark.unit
+def test_frame_producer_stop_discards_pending_frame():
+    """Test FrameProducer.stop() stops the thread and drops any pending frame."""
+    player = Mock()
+    player.get_frame.return_value = VideoFrame(pixels=b"test", width=1, height=1, timestamp=0.0)
+
+    producer = FrameProducer(player)
+    producer.start()
+    assert _wait_for(lambda: player.get_frame.call_count >= 1)
+
+    assert producer.stop() is True
+    assert producer.take_frame() is None
+
+
+@pytest.mark.unit
+def test_frame_producer_stop_reports_thread_still_in_get_frame():
+    """Test FrameProducer.stop() returns False while get_frame() has not returned."""
+    release = threading.Event()
+    player = Mock()
+    player.get_frame.side_effect = lambda: release.wait(5) and None
+
+    producer = FrameProducer(player)
+    producer.start()
+    assert _wait_for(lambda: player.get_frame.call_count == 1)
+
+    assert producer.stop(timeout=0.05) is False
+    release.set()
+    assert producer.stop() is True
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("delay", "expected"),
+    [
+        (0.04, 0.04),  # Decoder-reported wait is honored
+        (0.0, FrameProducer.MIN_POLL_INTERVAL),
+        (5.0, FrameProducer.MAX_POLL_INTERVAL),
+        (None, 0.02),  # Paused / end of stream: default idle interval
+    ],
+)
+def test_frame_producer_poll_interval_follows_decoder_delay(delay, expected):
+    """Test FrameProducer waits as long as the decoder asks, within bounds."""
+    player = Mock()
+    player.get_frame_delay.return_value = delay
+
+    assert FrameProducer(player)._poll_interval() == expected